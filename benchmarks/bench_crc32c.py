@@ -0,0 +1,55 @@
+"""Compares CRC32C implementations on typical BOC sizes.
+
+python benchmarks/bench_crc32c.py
+"""
+
+import os
+import timeit
+from functools import partial
+
+from tonsdk_ng.types import begin_cell, begin_dict
+from tonsdk_ng.utils import _utils
+
+
+def crc32c_bitwise(crc: int, b: bytes) -> int:
+    # the original bit-by-bit implementation, kept as a baseline
+    crc ^= 0xFFFFFFFF
+    for byte in b:
+        crc ^= byte
+        for _ in range(8):
+            crc = (crc >> 1) ^ 0x82F63B78 if crc & 1 else crc >> 1
+    return crc ^ 0xFFFFFFFF
+
+
+def dict_boc(n: int) -> bytes:
+    builder = begin_dict(32)
+    for i in range(n):
+        builder.store_cell(i, begin_cell().store_uint(i, 64).end_cell())
+    return builder.end_dict().to_boc()
+
+
+def main() -> None:
+    samples = {
+        "10 entries dict": dict_boc(10),
+        "1k entries dict": dict_boc(1000),
+        "100 KB random": os.urandom(100_000),
+        "1 MB random": os.urandom(1_000_000),
+    }
+    impls = {"bitwise": crc32c_bitwise, "table": _utils._crc32c_table}
+    if _utils.CRC32C_BACKEND != "table":
+        impls[_utils.CRC32C_BACKEND] = _utils._crc32c_ext
+
+    print(f"{'sample':<20}{'size':>10}", *(f"{n:>12}" for n in impls))
+    for name, data in samples.items():
+        expected = crc32c_bitwise(0, data)
+        row = []
+        for impl in impls.values():
+            assert impl(0, data) == expected
+            number = 1 if impl is crc32c_bitwise else 10
+            seconds = timeit.timeit(partial(impl, 0, data), number=number)
+            row.append(f"{seconds / number * 1000:>10.3f}ms")
+        print(f"{name:<20}{len(data):>10}", *row)
+
+
+if __name__ == "__main__":
+    main()
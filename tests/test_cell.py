@@ -0,0 +1,443 @@
+import base64
+import io
+import pickle
+import random
+import threading
+
+import pytest
+
+from tonsdk_ng.types import (
+    Address,
+    Cell,
+    CellStore,
+    begin_cell,
+    begin_dict,
+    disable_cell_interning,
+    enable_cell_interning,
+    from_boc_multi_root,
+    get_cell_store,
+    to_boc_multi_root,
+    write_boc_multi_root,
+)
+from tonsdk_ng.types._bit_string import BitString
+from tonsdk_ng.utils import crc16, crc16_many, crc32c, topological_sort
+from tonsdk_ng.utils._utils import _crc32c_table
+
+
+def make_dag(depth: int) -> Cell:
+    cell = begin_cell().store_uint(1, 8).end_cell()
+    for i in range(depth):
+        cell = (
+            begin_cell().store_uint(i, 16).store_ref(cell).store_ref(cell)
+        ).end_cell()
+    return cell
+
+
+def test_cell_freeze():
+    child = Cell()
+    child.bits.write_uint(5, 8)
+    root = Cell()
+    root.refs.append(child)
+    h = root.bytes_hash()
+
+    root.freeze()
+    assert root.is_frozen() and child.is_frozen()
+    assert root.bytes_hash() == h
+
+    with pytest.raises(Exception, match="frozen"):
+        root.bits.write_bit(1)
+    with pytest.raises(Exception, match="frozen"):
+        child.refs.append(Cell())
+    with pytest.raises(Exception, match="frozen"):
+        root.write_cell(child)
+
+
+def test_cell_frozen_copy():
+    leaf = begin_cell().store_uint(1, 8).end_cell()
+    child = Cell()
+    child.bits.write_uint(5, 8)
+    child.refs.append(leaf)
+    root = Cell()
+    root.refs.extend((child, child))
+
+    copy = root.frozen_copy()
+    assert copy.is_frozen() and copy.bytes_hash() == root.bytes_hash()
+    assert not root.is_frozen() and not child.is_frozen()
+    assert copy.refs[0] is copy.refs[1] is not child
+    assert copy.refs[0].refs[0] is leaf
+    assert leaf.frozen_copy() is leaf
+    child.bits.write_bit(1)
+    assert copy.bytes_hash() != root.bytes_hash()
+
+
+def test_cell_unfrozen_hash_follows_mutations():
+    cell = Cell()
+    h = cell.bytes_hash()
+    cell.bits.write_bit(1)
+    assert cell.bytes_hash() != h
+
+
+def test_builder_end_cell():
+    builder = begin_cell().store_uint(1, 8)
+    cell = builder.end_cell()
+    builder.store_uint(2, 8)
+    assert cell.is_frozen()
+    assert cell.bits.get_used_bits() == 8
+
+
+def test_cell_dag_hash():
+    # 2 ** 200 paths, would never finish without visiting cells once
+    root = make_dag(200)
+    assert root.get_max_depth() == 200
+    assert len(root.bytes_hash()) == 32
+
+
+@pytest.mark.parametrize(
+    "has_idx, hash_crc32, has_cache_bits",
+    [(True, True, False), (False, False, False), (True, False, True)],
+)
+def test_cell_boc_roundtrip(has_idx, hash_crc32, has_cache_bits):
+    root = make_dag(10)
+    boc = root.to_boc(has_idx, hash_crc32, has_cache_bits)
+    parsed = Cell.one_from_boc(boc)
+    assert parsed.is_frozen()
+    assert parsed.bytes_hash() == root.bytes_hash()
+    assert parsed.to_boc(has_idx, hash_crc32, has_cache_bits) == boc
+
+    stream = io.BytesIO()
+    assert root.write_boc(stream, has_idx, hash_crc32, has_cache_bits) == len(
+        boc
+    )
+    assert stream.getvalue() == boc
+
+
+def test_cell_boc_wide_refs():
+    builder = begin_dict(16)
+    for i in range(200):
+        builder.store_cell(i, begin_cell().store_uint(i, 16).end_cell())
+    root = builder.end_dict()
+
+    boc = root.to_boc()
+    # more than 255 cells, refs take 2 bytes
+    assert boc[4] & 0b111 == 2
+    assert Cell.one_from_boc(boc).bytes_hash() == root.bytes_hash()
+
+
+def test_topological_sort():
+    leaf = begin_cell().store_uint(7, 8).end_cell()
+    mid = begin_cell().store_ref(leaf).store_ref(leaf).end_cell()
+    root = Cell()
+    root.refs += [leaf, mid, make_dag(50)]
+
+    order, index = topological_sort([root])
+    assert order[0][1] is root
+    assert len(order) == len(index) == 3 + 51
+    for i, (_, cell) in enumerate(order):
+        assert all(index[ref.bytes_hash()] > i for ref in cell.refs)
+
+
+def test_to_boc_leaves_tree_untouched():
+    root = Cell()
+    root.refs.append(make_dag(5))
+    boc = root.to_boc()
+    assert not root.is_frozen()
+    root.bits.write_uint(1, 8)
+    assert root.to_boc() != boc
+
+
+def test_boc_multi_root():
+    code = make_dag(30)
+    roots = [
+        begin_cell().store_uint(i, 32).store_ref(code).end_cell()
+        for i in range(5)
+    ]
+    roots.append(code)
+
+    boc = to_boc_multi_root(roots)
+    parsed = from_boc_multi_root(boc)
+    assert [c.bytes_hash() for c in parsed] == [c.bytes_hash() for c in roots]
+    # shared code is stored once: 31 code cells and 5 own cells
+    assert boc[6] == 31 + 5
+
+    stream = io.BytesIO()
+    assert write_boc_multi_root(stream, roots) == len(boc)
+    assert stream.getvalue() == boc
+
+    stream = io.BytesIO()
+    no_crc = to_boc_multi_root(roots, hash_crc32=False)
+    assert write_boc_multi_root(stream, roots, hash_crc32=False) == len(no_crc)
+    assert stream.getvalue() == no_crc
+
+
+@pytest.mark.parametrize("has_idx", [True, False])
+def test_boc_lazy(has_idx):
+    left = make_dag(20)
+    right = begin_cell().store_uint(42, 64).store_ref(make_dag(3)).end_cell()
+    root = begin_cell().store_ref(left).store_ref(right).end_cell()
+    boc = root.to_boc(has_idx)
+
+    lazy = Cell.one_from_boc(boc, lazy=True)
+    assert lazy.is_frozen()
+    assert lazy.refs[1].begin_parse().read_uint(64) == 42
+    # the left subtree is not decoded yet
+    assert lazy.refs[0]._bits is None
+
+    assert lazy.bytes_hash() == root.bytes_hash()
+    assert lazy.to_boc(has_idx) == boc
+    assert pickle.loads(pickle.dumps(lazy)).bytes_hash() == root.bytes_hash()
+    with pytest.raises(Exception, match="frozen"):
+        lazy.refs[1].bits.write_bit(1)
+
+
+def test_boc_from_base64():
+    root = make_dag(5)
+    boc = root.to_boc()
+    for data in (boc.hex(), base64.b64encode(boc).decode()):
+        assert Cell.one_from_boc(data).bytes_hash() == root.bytes_hash()
+    urlsafe = base64.urlsafe_b64encode(boc).decode()
+    assert Cell.one_from_boc(urlsafe).bytes_hash() == root.bytes_hash()
+
+
+def test_many_from_boc():
+    roots = [make_dag(i) for i in range(20)]
+    bocs = [base64.b64encode(root.to_boc()).decode() for root in roots]
+    for workers, chunk_size in ((1, 64), (2, 3)):
+        cells = Cell.many_from_boc(bocs, workers, chunk_size=chunk_size)
+        assert [c.bytes_hash() for c in cells] == [
+            r.bytes_hash() for r in roots
+        ]
+        assert all(c.is_frozen() for c in cells)
+        assert [c.to_boc() for c in cells] == [r.to_boc() for r in roots]
+
+
+def test_crc32c():
+    data = b"123456789"
+    assert crc32c(data) == (0xE3069283).to_bytes(4, "little")
+    for size in (0, 1, 7, 8, 9, 100):
+        chunk = bytes(range(size))
+        assert _crc32c_table(0, chunk) == int.from_bytes(
+            crc32c(chunk), "little"
+        )
+        assert crc32c(chunk, crc32c(data)) == crc32c(data + chunk)
+
+
+def test_crc16():
+    assert crc16(b"123456789") == (0x31C3).to_bytes(2, "big")
+    payloads = [bytes([0x11, 0]) + bytes([i]) * 32 for i in range(50)]
+    assert crc16_many(payloads) == [crc16(p) for p in payloads]
+    with pytest.raises(ValueError):
+        crc16_many([b"short"])
+    # the joined length fits, but the payloads do not
+    with pytest.raises(ValueError):
+        crc16_many([bytes(33), bytes(35)])
+
+
+def test_address_many_to_string():
+    addresses = [
+        Address.from_string("EQBvW8Z5huBkMJYdnfAEM5JqTNkuWX3diqYENkWsIL0XggGG"),
+        Address.from_string("0:" + "ab" * 32),
+        Address.from_string("-1:" + "cd" * 32),
+    ]
+    for flags in ((), (True, True, False, True), (True, False, True)):
+        assert Address.many_to_string(addresses, *flags) == [
+            a.to_string(*flags) for a in addresses
+        ]
+    friendly = addresses[2].to_string(True)
+    assert Address.from_string(friendly).wc == -1
+
+
+def test_bit_string_word_writes():
+    rng = random.Random(1)
+    for _ in range(300):
+        offset = rng.randrange(16)
+        bit_length = rng.randrange(1, 300)
+        number = rng.getrandbits(bit_length)
+        signed = number - (1 << (bit_length - 1))
+        amount = number & ((1 << 120) - 1)
+
+        fast, slow = BitString(1023), BitString(1023)
+        fast.array[:] = b"\xff" * len(fast.array)  # garbage is overwritten
+        for b in (fast, slow):
+            b.write_uint(0, offset)
+        fast.write_uint(number, bit_length)
+        fast.write_int(signed, bit_length)
+        fast.write_grams(amount)
+        bits = f"{number:0{bit_length}b}"
+        bits += f"{signed & ((1 << bit_length) - 1):0{bit_length}b}"
+        size = (amount.bit_length() + 7) // 8
+        bits += f"{size:04b}" + (f"{amount:0{size * 8}b}" if size else "")
+        for bit in bits:
+            slow.write_bit(bit)
+        assert fast.cursor == slow.cursor
+        assert fast.get_top_upped_array() == slow.get_top_upped_array()
+
+    b = BitString(8)
+    with pytest.raises(ValueError):
+        b.write_uint(256, 8)
+    with pytest.raises(ValueError):
+        b.write_int(-129, 8)
+    with pytest.raises(Exception, match="overflow"):
+        b.write_uint(1, 9)
+    assert b.cursor == 0
+
+
+def test_bit_string_bulk_copy():
+    rng = random.Random(2)
+    for _ in range(200):
+        src = BitString(1023)
+        src.write_uint(rng.getrandbits(300), 300)
+        src.cursor = rng.randrange(300)
+        data = rng.randbytes(rng.randrange(20))
+
+        fast, slow = BitString(1023), BitString(1023)
+        fast.array[:] = b"\xff" * len(fast.array)
+        offset = rng.randrange(16)
+        for b in (fast, slow):
+            b.write_uint(0, offset)
+        fast.write_bit_string(src)
+        fast.write_bytes(data)
+        for bit in [src.get(i) for i in range(src.cursor)]:
+            slow.write_bit(bit)
+        for bit in "".join(f"{byte:08b}" for byte in data):
+            slow.write_bit(bit)
+        assert fast.cursor == slow.cursor
+        assert fast.get_top_upped_array() == slow.get_top_upped_array()
+
+    cell = begin_cell().store_uint(5, 1000).end_cell()
+    composed = Cell()
+    composed.write_cell(cell)
+    with pytest.raises(Exception, match="overflow"):
+        composed.write_cell(cell)
+
+
+def test_cell_cached_data_with_descriptors():
+    cell = begin_cell().store_uint(5, 12).store_ref(make_dag(1)).end_cell()
+    data = cell.get_data_with_descriptors()
+    assert data == bytes([1, 3, 0x00, 0x58])
+    assert cell.get_data_with_descriptors() is data
+    assert cell.bytes_repr().startswith(data)
+    assert cell.serialize_for_boc({cell.refs[0].bytes_hash(): 1}, 1) == (
+        data + b"\x01"
+    )
+
+
+def test_slice_reads():
+    ref = make_dag(1)
+    cell = (
+        begin_cell()
+        .store_uint(5, 3)
+        .store_int(-7, 12)
+        .store_bytes(b"abc")
+        .store_ref(ref)
+        .store_ref(ref)
+        .end_cell()
+    )
+    s = cell.begin_parse()
+    assert len(s) == 3 + 12 + 24
+    assert s.preload_uint(3) == 5
+    assert s.read_uint(3) == 5
+    assert s.preload_int(12) == s.read_int(12) == -7
+
+    sub = s.preload_slice(16, 1)
+    assert sub.read_bytes(2) == b"ab"
+    assert sub.read_ref() is ref
+    sub.end_parse()
+    assert s.read_slice(8).read_bytes(1) == b"a"
+
+    copy = begin_cell().store_slice(s).end_cell()
+    assert copy.begin_parse().read_bytes(2) == b"bc"
+    assert len(copy.refs) == 2
+
+    assert s.read_string() == "bc"
+    with pytest.raises(Exception, match="underflow"):
+        s.read_bit()
+    s.read_ref(), s.read_ref()
+    s.end_parse()
+
+
+def test_slice_of_unfrozen_cell_is_a_snapshot():
+    cell = Cell()
+    cell.bits.write_uint(1, 8)
+    s = cell.begin_parse()
+    cell.bits.array[0] = 0xFF
+    assert s.read_uint(8) == 1
+
+
+def test_slice_integer_reads():
+    rng = random.Random(3)
+    for _ in range(100):
+        fields = [(rng.randrange(1, 300), rng.random() < 0.5) for _ in range(3)]
+        values = []
+        builder = begin_cell()
+        for bit_length, signed in fields:
+            if signed:
+                value = rng.getrandbits(bit_length) - (1 << (bit_length - 1))
+                builder.store_int(value, bit_length)
+            else:
+                value = rng.getrandbits(bit_length)
+                builder.store_uint(value, bit_length)
+            values.append(value)
+        if builder.bits.get_free_bits() < 100:
+            continue
+        builder.store_coins(values[0] % 10**18)
+        s = builder.end_cell().begin_parse()
+        for (bit_length, signed), value in zip(fields, values, strict=True):
+            assert (s.read_int if signed else s.read_uint)(bit_length) == value
+        assert s.read_coins() == values[0] % 10**18
+        s.end_parse()
+
+
+def test_slice_read_msg_addr():
+    for raw in ("0:" + "ab" * 32, "-1:" + "01" * 32):
+        address = Address.from_string(raw)
+        s = begin_cell().store_bit(1).store_address(address).end_cell()
+        s = s.begin_parse()
+        s.skip_bits(1)
+        parsed = s.read_msg_addr()
+        assert parsed is not None and parsed.to_string() == raw
+        assert s.is_empty()
+
+
+def test_cell_interning():
+    store = enable_cell_interning(max_size=4)
+    try:
+        leaf = begin_cell().store_uint(1, 8).end_cell()
+        assert begin_cell().store_uint(1, 8).end_cell() is leaf
+        root = begin_cell().store_ref(leaf).store_ref(leaf).end_cell()
+
+        # parsed trees are canonical down to the shared leaves
+        parsed = Cell.one_from_boc(root.to_boc())
+        assert parsed is root
+        other = begin_cell().store_uint(2, 8).store_ref(leaf).end_cell()
+        store.clear()
+        parsed = Cell.one_from_boc(other.to_boc())
+        assert parsed.refs[0] is Cell.one_from_boc(leaf.to_boc())
+        assert Cell.one_from_boc(leaf.to_boc(), lazy=True) is not leaf
+
+        # the least recently used cells are evicted
+        for i in range(10):
+            begin_cell().store_uint(i, 16).end_cell()
+        assert len(store) == 4
+        assert parsed.bytes_hash() not in store
+    finally:
+        disable_cell_interning()
+    assert get_cell_store() is None
+    assert begin_cell().end_cell() is not begin_cell().end_cell()
+
+
+def test_cell_store_counts_from_threads():
+    store = CellStore()
+    leaves = [begin_cell().store_uint(i, 16).end_cell() for i in range(500)]
+
+    def intern_all():
+        for leaf in leaves:
+            store.intern(leaf)
+
+    threads = [threading.Thread(target=intern_all) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    # every interned leaf is counted once, as a hit or a miss
+    assert store.hits + store.misses == 4 * len(leaves)
+    assert store.misses >= len(leaves)
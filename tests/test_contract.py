@@ -0,0 +1,195 @@
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from tonsdk_ng.contract.token.nft import NFTItem
+from tonsdk_ng.contract.wallet import (
+    HighloadQueryId,
+    HighloadWalletV3Contract,
+    MultiSigWallet,
+    Wallets,
+    WalletV3ContractR2,
+    WalletV4ContractR2,
+    WalletVersionEnum,
+)
+from tonsdk_ng.crypto.exceptions import InvalidMnemonicsError
+from tonsdk_ng.types import Cell
+
+PUBLIC_KEY = bytes(range(32))
+
+
+def test_code_cells_are_shared():
+    first = WalletV4ContractR2(public_key=PUBLIC_KEY, private_key=PUBLIC_KEY)
+    second = WalletV4ContractR2(public_key=bytes(32), private_key=bytes(32))
+    assert first.options["code"] is second.options["code"]
+    assert first.options["code"].bytes_hash().hex() == (
+        "feb5ff6820e2ff0d9483e7e0d62c817d846789fb4ae580c878866d959dabd5c0"
+    )
+    assert NFTItem().options["code"] is NFTItem().options["code"]
+    # an empty code cell is not replaced with the default code
+    empty = Cell()
+    assert NFTItem(code=empty).options["code"] is empty
+
+
+def test_state_init_is_memoized():
+    wallet = WalletV4ContractR2(public_key=PUBLIC_KEY, private_key=PUBLIC_KEY)
+    state_init = wallet.create_state_init()
+    again = wallet.create_state_init()
+    assert again is not state_init
+    assert again["state_init"] is state_init["state_init"]
+    assert again["address"] is state_init["address"]
+    assert wallet.address.to_string(True, True, True) == (
+        "EQB8OA8kKll0n2kvUik0w91g_x3vOFVTSYYXArscqSWGI573"
+    )
+
+    v3 = WalletV3ContractR2(public_key=PUBLIC_KEY, private_key=PUBLIC_KEY)
+    assert v3.address.to_string(True, True, True) == (
+        "EQDwhxUcS0H5YcHg6xgOgoyLlBYxvi9TFMclHt3gv8Xl0jH4"
+    )
+    message = v3.create_transfer_message(v3.address, 1, seqno=0)
+    assert message["state_init"] is v3.create_state_init()["state_init"]
+
+
+def test_state_init_follows_options():
+    wallet = WalletV3ContractR2(public_key=PUBLIC_KEY, private_key=PUBLIC_KEY)
+    address = wallet.address
+    wallet.options["wallet_id"] = 7
+    fresh = WalletV3ContractR2(
+        public_key=PUBLIC_KEY, private_key=PUBLIC_KEY, wallet_id=7
+    )
+    assert wallet.address.to_string() == fresh.address.to_string()
+    assert wallet.address.to_string() != address.to_string()
+    assert wallet.create_state_init()["address"] is wallet.address
+
+    public_keys = [PUBLIC_KEY, bytes(32)]
+    multisig = MultiSigWallet(
+        public_key=PUBLIC_KEY, public_keys=public_keys, k=1
+    )
+    address = multisig.address
+    public_keys.append(bytes([1]) * 32)
+    fresh = MultiSigWallet(
+        public_key=PUBLIC_KEY, public_keys=list(public_keys), k=1
+    )
+    assert multisig.address.to_string() == fresh.address.to_string()
+    assert multisig.address.to_string() != address.to_string()
+
+
+def test_highload_v3_deploy():
+    wallet = HighloadWalletV3Contract(
+        public_key=PUBLIC_KEY, private_key=bytes(64), timeout=3600
+    )
+    assert wallet.options["wallet_id"] == 0x10AD
+    message = wallet.create_external_message(
+        wallet.create_signing_message(
+            HighloadQueryId(), created_at=0, send_mode=3, messages_to_send=[]
+        ),
+        bytes(64),
+        need_deploy=True,
+    )
+    assert message["state_init"] is wallet.create_state_init()["state_init"]
+    assert message["address"] is wallet.address
+
+
+def test_derive_addresses():
+    keys = [bytes([i]) * 32 for i in range(10)]
+    for version in WalletVersionEnum:
+        options = {"timeout": 3600} if version == WalletVersionEnum.hv3 else {}
+        wallets = [
+            Wallets.ALL[version](public_key=key, private_key=key, **options)
+            for key in keys
+        ]
+        addresses = Wallets.derive_addresses(version, keys, **options)
+        assert [a.to_string() for a in addresses] == [
+            w.address.to_string() for w in wallets
+        ]
+
+    wallets = [
+        WalletV3ContractR2(public_key=key, private_key=key, wc=-1, wallet_id=7)
+        for key in keys
+    ]
+    with ThreadPoolExecutor(2) as executor:
+        addresses = Wallets.derive_addresses(
+            WalletVersionEnum.v3r2,
+            keys,
+            wallet_id=7,
+            workchain=-1,
+            executor=executor,
+            chunk_size=3,
+        )
+    assert [a.to_string() for a in addresses] == [
+        w.address.to_string() for w in wallets
+    ]
+
+
+def test_wallets_in_bulk():
+    created = Wallets.create_many(3, WalletVersionEnum.v3r2, workers=2)
+    mnemonics = [wallet[0] for wallet in created]
+    addresses = [
+        Wallets.from_mnemonics(m, WalletVersionEnum.v3r2).address.to_string()
+        for m in mnemonics
+    ]
+    assert [w.address.to_string() for *_, w in created] == addresses
+
+    restored = Wallets.from_mnemonics_many(
+        mnemonics, WalletVersionEnum.v3r2, workers=2, chunk_size=2
+    )
+    assert [w.address.to_string() for w in restored] == addresses
+
+    with ThreadPoolExecutor(2) as executor:
+        restored = asyncio.run(
+            Wallets.from_mnemonics_many_async(
+                mnemonics, WalletVersionEnum.v3r2, executor=executor
+            )
+        )
+    assert [w.address.to_string() for w in restored] == addresses
+
+    with pytest.raises(InvalidMnemonicsError):
+        Wallets.from_mnemonics_many([mnemonics[0], ["abandon"] * 24])
+
+
+def test_transfer_messages_in_bulk(monkeypatch):
+    monkeypatch.setattr(time, "time", lambda: 1_700_000_000)
+    wallet = WalletV4ContractR2(public_key=PUBLIC_KEY, private_key=bytes(64))
+    to = wallet.address.to_string(True, True, True)
+    jobs = [
+        (seqno, [{"to_address": to, "amount": seqno + 1, "payload": "hi"}])
+        for seqno in range(5)
+    ]
+    expected = [
+        wallet.create_transfer_messages(seqno, messages)["message"].to_boc(
+            False
+        )
+        for seqno, messages in jobs
+    ]
+    assert wallet.create_transfer_messages_many(jobs) == expected
+    # a payload too long to be inlined, with a ref
+    payload = Cell()
+    payload.bits.write_bytes(bytes(100))
+    payload.refs.append(Cell())
+    payload_jobs = [(0, [{"to_address": to, "amount": 1, "payload": payload}])]
+    wallet.create_transfer_messages_many(payload_jobs)
+    assert not payload.is_frozen() and not payload.refs[0].is_frozen()
+    with ThreadPoolExecutor(2) as executor:
+        assert (
+            wallet.create_transfer_messages_many(
+                jobs, executor=executor, chunk_size=2
+            )
+            == expected
+        )
+
+    highload = Wallets.ALL[WalletVersionEnum.hv2](
+        public_key=PUBLIC_KEY, private_key=bytes(64)
+    )
+    jobs = [(query_id, [{"address": to, "amount": 1}]) for query_id in (1, 2)]
+    highload.create_transfer_messages_many(
+        [(1, [{"address": to, "amount": 1, "payload": payload}])]
+    )
+    assert not payload.is_frozen() and not payload.refs[0].is_frozen()
+    assert highload.create_transfer_messages_many(jobs) == [
+        highload.create_transfer_message(recipients, query_id)[
+            "message"
+        ].to_boc(False)
+        for query_id, recipients in jobs
+    ]
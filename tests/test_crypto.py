@@ -0,0 +1,15 @@
+from concurrent.futures import ThreadPoolExecutor
+
+from tonsdk_ng.crypto import mnemonic_is_valid, mnemonic_new, mnemonic_new_many
+
+
+def test_mnemonic_new_many():
+    assert mnemonic_is_valid(mnemonic_new())
+    with ThreadPoolExecutor(2) as executor:
+        for mnemonics in (
+            mnemonic_new_many(5, workers=1),
+            mnemonic_new_many(5, executor=executor, chunk_size=2),
+        ):
+            assert len(mnemonics) == 5
+            assert len({tuple(m) for m in mnemonics}) == 5
+            assert all(mnemonic_is_valid(m) for m in mnemonics)
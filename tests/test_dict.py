@@ -0,0 +1,126 @@
+import random
+
+import pytest
+
+from tonsdk_ng.types import (
+    DictReader,
+    PersistentDict,
+    begin_cell,
+    begin_dict,
+    parse_dict,
+)
+
+
+def build(keys, key_size):
+    builder = begin_dict(key_size)
+    for key in keys:
+        builder.store_cell(
+            key, begin_cell().store_uint(key, key_size).end_cell()
+        )
+    return builder.end_dict()
+
+
+@pytest.mark.parametrize("key_size, count", [(8, 1), (8, 256), (32, 100)])
+def test_parse_dict_is_inverse_of_serialize_dict(key_size, count):
+    rng = random.Random(key_size + count)
+    keys = rng.sample(range(1 << key_size), count)
+    values = parse_dict(build(keys, key_size), key_size)
+    assert list(values) == sorted(keys)
+    for key, value in values.items():
+        expected = begin_cell().store_uint(key, key_size).end_cell()
+        assert value.bytes_hash() == expected.bytes_hash()
+
+
+def test_dict_reader_get():
+    keys = [0, 1, 5, 200, 255]
+    reader = DictReader(build(keys, 8), 8, lambda s: s.read_uint(8))
+    for key in range(256):
+        assert reader.get(key) == (key if key in keys else None)
+    assert reader[bytes([200])] == 200
+    assert 5 in reader and 6 not in reader
+    with pytest.raises(KeyError):
+        reader[6]
+    with pytest.raises(ValueError):
+        reader.get(256)
+
+
+def test_dict_reader_scans():
+    rng = random.Random(1)
+    keys = sorted(rng.sample(range(1 << 16), 300))
+    reader = DictReader(build(keys, 16), 16, lambda s: s.read_uint(16))
+    assert list(reader) == keys
+    assert list(reader.values()) == keys
+
+    for _ in range(20):
+        lo, hi = sorted(rng.sample(range(1 << 16), 2))
+        assert [k for k, _ in reader.items(lo, hi)] == [
+            k for k in keys if lo <= k < hi
+        ]
+    prefix = keys[0] >> 10
+    assert [k for k, _ in reader.prefix_items(prefix, 6)] == [
+        k for k in keys if k >> 10 == prefix
+    ]
+    assert list(reader.prefix_items(0, 0)) == list(reader.items())
+
+
+def test_dict_reader_from_slice():
+    root = build([3, 4], 8)
+    cell = begin_cell().store_maybe_ref(root).store_maybe_ref(None).end_cell()
+    s = cell.begin_parse()
+    assert list(DictReader.from_slice(s, 8)) == [3, 4]
+    assert list(DictReader.from_slice(s, 8)) == []
+
+
+def test_serialize_dict_labels():
+    # a single key is one hml_same$11 edge: v=1, n=64 in 7 bits
+    s = build([2**64 - 1], 64).begin_parse()
+    assert s.read_uint(10) == 0b111_1000000
+    # keys 0 and 2**64-1 fork at the root, the children have 63-bit
+    # hml_same labels
+    root = build([0, 2**64 - 1], 64)
+    assert root.begin_parse().read_uint(2) == 0
+    assert root.refs[0].begin_parse().read_uint(9) == 0b110_111111
+    assert root.refs[1].begin_parse().read_uint(9) == 0b111_111111
+
+    with pytest.raises(ValueError):
+        build([256], 8)
+
+
+def test_persistent_dict_matches_rebuilt_dict():
+    rng = random.Random(3)
+    expected = {}
+    d = PersistentDict(None, 16)
+    for step in range(300):
+        if expected and rng.random() < 0.4:
+            key = rng.choice(list(expected))
+            d = d.delete(key)
+            del expected[key]
+        else:
+            key = rng.getrandbits(16)
+            value = begin_cell().store_uint(step, 16).end_cell()
+            d = d.set(key, value)
+            expected[key] = value
+        if step % 30 == 0:
+            root = PersistentDict.from_items(expected, 16).root
+            assert d.root.bytes_hash() == root.bytes_hash()
+    assert list(d) == sorted(expected)
+    with pytest.raises(KeyError):
+        d.delete(rng.choice([k for k in range(1 << 16) if k not in d]))
+
+
+def test_persistent_dict_shares_untouched_cells():
+    d = PersistentDict(build(range(0, 256, 3), 8), 8)
+    value = begin_cell().store_uint(1, 8).end_cell()
+    updated = d.set(0, value)
+    assert updated[0].bytes_hash() == value.bytes_hash()
+    assert d[0].begin_parse().read_uint(8) == 0
+    # the root and the left half are copied, the right half is shared
+    assert updated.root is not d.root
+    assert updated.root.refs[1] is d.root.refs[1]
+    assert updated.root.refs[0] is not d.root.refs[0]
+
+    merged = d.merge({1: value, 0: value})
+    assert list(merged) == [0, 1, *range(3, 256, 3)]
+    assert merged.delete(1).delete(0).set(0, d[0]).root.bytes_hash() == (
+        d.root.bytes_hash()
+    )
@@ -0,0 +1,174 @@
+import pytest
+
+from tonsdk_ng.types import (
+    Cell,
+    CellType,
+    begin_cell,
+    check_merkle_proof,
+    create_library_cell,
+    create_merkle_proof,
+    create_pruned_branch,
+)
+
+
+def make_tree() -> Cell:
+    leaf = begin_cell().store_uint(7, 32).end_cell()
+    node = begin_cell().store_uint(2, 8).store_ref(leaf).end_cell()
+    return (
+        begin_cell().store_uint(1, 8).store_ref(leaf).store_ref(node).end_cell()
+    )
+
+
+ROOT_HASH = "75306b7d6ab6ebbf4197cfad856f0a8e31d198dc2ef926079f489ca31095d5d0"
+PROVED_HASH = "057f89b016702be54749a1089d42c228dc6f30da5b9b839afba105bd0d3e6e9c"
+PROOF_HASH = "83f8a2e3cbaefadad73efe6ebf3e980b26915f7c5f6c4d36746fbf6484fed8ad"
+
+
+def test_merkle_proof_hashes():
+    root = make_tree()
+    proof = create_merkle_proof(root, [root.refs[1].bytes_hash()])
+    proved = proof.refs[0]
+    # the leaf is not kept, so it is pruned under both parents
+    assert proved.refs[0].get_type() == CellType.PRUNED_BRANCH
+    assert proved.refs[1].refs[0] is proved.refs[0]
+
+    assert proved.get_level_mask() == 1
+    assert proved.get_hash(0) == root.bytes_hash() == bytes.fromhex(ROOT_HASH)
+    assert proved.get_hash(1) == proved.bytes_hash()
+    assert proved.bytes_hash() == bytes.fromhex(PROVED_HASH)
+    assert proof.get_level_mask() == 0
+    assert proof.bytes_hash() == bytes.fromhex(PROOF_HASH)
+
+    assert check_merkle_proof(proof, root.bytes_hash()) is proved
+    with pytest.raises(ValueError, match="another tree"):
+        check_merkle_proof(proof, bytes(32))
+
+    restored = Cell.one_from_boc(proof.to_boc())
+    assert restored.bytes_hash() == proof.bytes_hash()
+    assert restored.refs[0].get_hash(0) == root.bytes_hash()
+
+
+def test_merkle_proof_of_another_tree_is_rejected():
+    root = make_tree()
+    proof = create_merkle_proof(root, [])
+    forged = Cell()
+    forged.is_exotic = True
+    forged.bits.write_uint(CellType.MERKLE_PROOF, 8)
+    forged.bits.write_bytes(root.bytes_hash())
+    forged.bits.write_uint(root.get_depth(), 16)
+    forged.refs.append(create_merkle_proof(root.refs[1], []).refs[0])
+    with pytest.raises(ValueError, match="does not match"):
+        forged.bytes_hash()
+    assert proof.bytes_hash() != root.bytes_hash()
+
+
+def test_merkle_proof_shares_whole_subtrees():
+    root = make_tree()
+    leaf, node = root.refs
+    proof = create_merkle_proof(root, [leaf.bytes_hash(), node.bytes_hash()])
+    assert proof.refs[0] is root
+    assert proof.get_level_mask() == 0
+
+
+def make_chain(depth: int) -> Cell:
+    root = Cell()
+    cell = root
+    for i in range(depth):
+        cell.bits.write_uint(i, 16)
+        ref = Cell()
+        cell.refs.append(ref)
+        cell = ref
+    return root
+
+
+def test_merkle_proof_of_unfrozen_tree(monkeypatch):
+    depth = 200
+    root = make_chain(depth)
+    cells = [root]
+    while cells[-1].refs:
+        cells.append(cells[-1].refs[0])
+    # the whole tree is kept
+    keep = [cell.get_hash() for cell in cells]
+    expected = create_merkle_proof(make_chain(depth).freeze(), keep)
+
+    calls = 0
+    compute_info = Cell._compute_info
+
+    def counting(self, refs_info):
+        nonlocal calls
+        calls += 1
+        return compute_info(self, refs_info)
+
+    monkeypatch.setattr(Cell, "_compute_info", counting)
+    proof = create_merkle_proof(root, keep)
+    # every cell of the tree and of the proof is hashed once
+    assert calls <= 2 * (depth + 1)
+    monkeypatch.undo()
+
+    assert not any(cell.is_frozen() for cell in cells)
+    assert proof.bytes_hash() == expected.bytes_hash()
+
+    leaf, other = Cell(), Cell()
+    leaf.bits.write_uint(1, 8)
+    other.bits.write_uint(2, 8)
+    mid = Cell()
+    mid.refs.append(leaf)
+    root = Cell()
+    root.refs.extend((mid, other))
+    proof = create_merkle_proof(root, [mid.bytes_hash(), leaf.bytes_hash()])
+    proved = proof.refs[0]
+    assert proved.refs[1].get_type() == CellType.PRUNED_BRANCH
+    assert proved.refs[0].refs[0].bytes_hash() == leaf.bytes_hash()
+    assert not any(c.is_frozen() for c in (root, mid, leaf, other))
+    leaf.bits.write_uint(1, 1)
+
+
+def test_pruned_branch_levels():
+    root = make_tree()
+    pruned = create_pruned_branch(root)
+    assert pruned.get_level_mask() == 1
+    assert pruned.get_hash(0) == root.bytes_hash()
+    assert pruned.get_depth(0) == root.get_depth()
+    assert pruned.get_depth() == 0
+
+    # pruning a level 1 cell at level 3 keeps both of its hashes
+    proved = create_merkle_proof(root, []).refs[0]
+    twice = create_pruned_branch(proved, 3)
+    assert twice.get_level_mask() == 0b101
+    assert twice.get_hash(0) == root.bytes_hash()
+    assert twice.get_hash(1) == twice.get_hash(2) == proved.bytes_hash()
+    assert twice.get_hash(3) == twice.bytes_hash()
+    with pytest.raises(ValueError):
+        create_pruned_branch(proved, 1)
+
+
+def test_boc_with_stored_hashes():
+    pruned = create_pruned_branch(make_tree())
+    boc = bytearray(pruned.to_boc(has_idx=False, hash_crc32=False))
+    # a single cell: header, sizes, the root index, then the cell data
+    assert boc[6:9] == b"\x01\x01\x00"
+    size_pos, cell_pos = 9, 11
+    info = pruned.get_info()
+    stored = b"".join(info.hashes) + b"".join(
+        depth.to_bytes(2, "big") for depth in info.depths
+    )
+    boc[cell_pos] |= 0b10000
+    boc[cell_pos + 2 : cell_pos + 2] = stored
+    boc[size_pos] += len(stored)
+
+    for lazy in (False, True):
+        restored = Cell.one_from_boc(bytes(boc), lazy=lazy)
+        assert restored.bytes_hash() == pruned.bytes_hash()
+
+
+def test_invalid_exotic_cells():
+    library = create_library_cell(bytes(range(32)))
+    assert library.get_type() == CellType.LIBRARY
+    assert library.get_level_mask() == 0
+
+    for data in (b"", b"\x07", b"\x01\x00", b"\x02\x00"):
+        cell = Cell()
+        cell.is_exotic = True
+        cell.bits.write_bytes(data)
+        with pytest.raises(ValueError):
+            cell.bytes_hash()
@@ -0,0 +1,139 @@
+import pytest
+
+from tonsdk_ng.contract import Contract
+from tonsdk_ng.contract.token.ft import JettonWallet
+from tonsdk_ng.contract.token.nft import NFTItem
+from tonsdk_ng.types import Address, TLBConstructor, begin_cell
+
+ADDRESS = Address.from_string("0:" + "ab" * 32)
+
+TRANSFER = TLBConstructor("""transfer#0f8a7ea5 query_id:uint64 amount:Coins
+    destination:MsgAddress response_destination:MsgAddress
+    custom_payload:(Maybe ^Cell) forward_ton_amount:Coins
+    forward_payload:(Either Cell ^Cell) = InternalMsgBody""")
+
+
+def test_tlb_matches_hand_written_layout():
+    payload = begin_cell().store_bytes(b"hello").end_cell()
+    cell = TRANSFER.encode(
+        query_id=7,
+        amount=10**9,
+        destination=ADDRESS,
+        response_destination=None,
+        custom_payload=None,
+        forward_ton_amount=1,
+        forward_payload=payload,
+    )
+    expected = (
+        begin_cell()
+        .store_uint(0x0F8A7EA5, 32)
+        .store_uint(7, 64)
+        .store_coins(10**9)
+        .store_address(ADDRESS)
+        .store_address(None)
+        .store_bit(0)
+        .store_coins(1)
+        .store_bit(0)
+        .store_bytes(b"hello")
+        .end_cell()
+    )
+    assert cell.bytes_hash() == expected.bytes_hash()
+
+    fields = TRANSFER.decode(cell)
+    assert fields["query_id"] == 7
+    assert fields["destination"].to_string() == ADDRESS.to_string()
+    assert fields["response_destination"] is None
+    assert fields["forward_payload"].bytes_hash() == payload.bytes_hash()
+    assert TRANSFER.encode(**fields).bytes_hash() == cell.bytes_hash()
+
+
+def test_tlb_fixed_fields():
+    schema = TLBConstructor(
+        "point$01 x:int7 flag:Bool id:(## 20) data:bits16 r:^Cell"
+        " y:int300 m:(Maybe uint8) = Point"
+    )
+    ref = begin_cell().end_cell()
+    for x, y, m in ((-64, -(2**299), None), (63, 2**299 - 1, 255)):
+        fields = {
+            "x": x,
+            "flag": True,
+            "id": 12345,
+            "data": b"\x01\x02",
+            "r": ref,
+            "y": y,
+            "m": m,
+        }
+        cell = schema.encode(**fields)
+        assert cell.bits.get_used_bits() == 2 + 7 + 1 + 20 + 16 + 300 + 1 + (
+            8 if m is not None else 0
+        )
+        decoded = schema.decode(cell)
+        assert decoded.pop("r") is ref
+        assert decoded == {k: v for k, v in fields.items() if k != "r"}
+
+    with pytest.raises(ValueError):
+        schema.encode(**{**fields, "x": 64})
+    with pytest.raises(ValueError, match="tag mismatch"):
+        TRANSFER.decode(cell)
+
+
+def test_tlb_payload_goes_to_ref_when_it_does_not_fit():
+    payload = begin_cell().store_bytes(bytes(100)).end_cell()
+    cell = TRANSFER.encode(
+        query_id=0,
+        amount=0,
+        destination=ADDRESS,
+        response_destination=ADDRESS,
+        custom_payload=None,
+        forward_ton_amount=0,
+        forward_payload=payload,
+    )
+    assert cell.refs[0] is payload
+    assert TRANSFER.decode(cell)["forward_payload"] is payload
+
+
+def test_tlb_store_into_builder():
+    builder = begin_cell().store_uint(1, 1)
+    TRANSFER.store(
+        builder,
+        query_id=0,
+        amount=0,
+        destination=ADDRESS,
+        response_destination=None,
+        custom_payload=begin_cell().end_cell(),
+        forward_ton_amount=0,
+        forward_payload=None,
+    )
+    s = builder.end_cell().begin_parse()
+    assert s.read_bit() == 1
+    assert TRANSFER.load(s)["destination"].to_string() == ADDRESS.to_string()
+
+
+def test_contract_messages_are_writable():
+    header = Contract.create_internal_message_header(ADDRESS, grams=5)
+    assert not header.is_frozen()
+    header.bits.write_uint(1, 1)
+    body = JettonWallet().create_transfer_body(ADDRESS, 1, forward_payload=b"x")
+    assert not body.is_frozen()
+    assert not NFTItem().create_transfer_body(ADDRESS).is_frozen()
+
+
+@pytest.mark.parametrize(
+    "schema",
+    [
+        "x#01 a:uint8",
+        "x#01 a:float = X",
+        "x#01 a:Cell b:uint8 = X",
+        "x#01 a:uint8 a:uint8 = X",
+        "x#zz a:uint8 = X",
+        "x#01 class:uint8 = X",
+        "x#01 from:Cell = X",
+        "x#01 len:bits8 = X",
+        "x#01 int:uint8 = X",
+        "x#01 store_payload:(Either Cell ^Cell) = X",
+        "x#01 read_address_int:MsgAddressInt = X",
+    ],
+)
+def test_tlb_invalid_schema(schema):
+    with pytest.raises(ValueError):
+        TLBConstructor(schema)
@@ -1,7 +1,8 @@
 import abc
+import functools
 from typing import Any, TypedDict, cast
 
-from ..types import Address, Cell
+from ..types import Address, Cell, TLBConstructor
 
 
 class StateInit(TypedDict):
@@ -28,9 +29,48 @@ class ExternalMessage(TypedDict):
     data: Cell | None
 
 
+def _snapshot(value: Any) -> Any:
+    """Copies nested dicts and lists, other values are kept as they are."""
+    if isinstance(value, dict):
+        return {key: _snapshot(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [_snapshot(item) for item in value]
+    return value
+
+
+@functools.lru_cache(maxsize=256)
+def code_cell_from_boc(boc: str | bytes) -> Cell:
+    """Parses a contract code BOC once, the frozen cell and its hashes are
+    shared by every contract with the same code."""
+    return Cell.one_from_boc(boc)
+
+
 class Contract(abc.ABC):
+    # BOC of the contract code, parsed once for all instances
+    code: str | None = None
+
+    EXTERNAL_MESSAGE_HEADER = TLBConstructor(
+        "ext_in_msg_info$10 src:MsgAddress dest:MsgAddressInt"
+        " import_fee:Coins = CommonMsgInfo"
+    )
+    INTERNAL_MESSAGE_HEADER = TLBConstructor(
+        "int_msg_info$0 ihr_disabled:Bool bounce:Bool bounced:Bool"
+        " src:MsgAddress dest:MsgAddressInt value:Coins extra:(Maybe ^Cell)"
+        " ihr_fee:Coins fwd_fee:Coins created_lt:uint64 created_at:uint32"
+        " = CommonMsgInfoRelaxed"
+    )
+
     def __init__(self, **kwargs: Any):
+        code = kwargs.get("code")
+        if code is None:
+            code = self.code
+        if isinstance(code, str | bytes):
+            self.code = code
+            kwargs["code"] = code_cell_from_boc(code)
         self.options = cast(Options, kwargs)
+        self._state_init: StateInit | None = None
+        # options the memoized state init was computed with
+        self._state_init_options: dict[str, Any] = {}
         self._address = (
             Address.from_any(kwargs["address"]) if "address" in kwargs else None
         )
@@ -42,26 +82,39 @@ class Contract(abc.ABC):
     @property
     def address(self) -> Address:
         if self._address is None:
-            self._address = self.create_state_init()["address"]
+            return self._get_state_init()["address"]
 
         return self._address
 
     def create_state_init(self) -> StateInit:
-        code_cell = self.create_code_cell()
-        data_cell = self.create_data_cell()
-        state_init = self.__create_state_init(code_cell, data_cell)
-        state_init_hash = state_init.bytes_hash()
+        """Returns the code, data, state init and address of the contract.
 
-        address = Address.from_string(
-            str(self.options["wc"]) + ":" + state_init_hash.hex()
-        )
+        They are computed on the first call and reused afterwards until the
+        options are changed, nested dicts and lists of the options included.
+        Cells are compared by identity, so option cells should be replaced
+        rather than modified. The cells are frozen."""
+        return cast(StateInit, dict(self._get_state_init()))
 
-        return {
-            "code": code_cell,
-            "data": data_cell,
-            "address": address,
-            "state_init": state_init,
-        }
+    def _get_state_init(self) -> StateInit:
+        if self._state_init is None or self.options != self._state_init_options:
+            options = _snapshot(self.options)
+            code_cell = self.create_code_cell()
+            data_cell = self.create_data_cell()
+            state_init = self.__create_state_init(code_cell, data_cell)
+            state_init_hash = state_init.freeze().bytes_hash()
+
+            address = Address.from_string(
+                str(self.options["wc"]) + ":" + state_init_hash.hex()
+            )
+            self._state_init = {
+                "code": code_cell,
+                "data": data_cell,
+                "address": address,
+                "state_init": state_init,
+            }
+            self._state_init_options = options
+
+        return self._state_init
 
     def create_code_cell(self) -> Cell:
         if "code" not in self.options or self.options["code"] is None:
@@ -87,6 +140,14 @@ class Contract(abc.ABC):
             "data": data,
         }
 
+    @staticmethod
+    def _writable(cell: Cell) -> Cell:
+        """Returns an unfrozen copy of an encoded cell, message headers and
+        bodies are returned unfrozen so that callers may append to them."""
+        copy = Cell()
+        copy.write_cell(cell)
+        return copy
+
     @classmethod
     def create_external_message_header(
         cls,
@@ -94,12 +155,13 @@ class Contract(abc.ABC):
         src: str | Address | None = None,
         import_fee: int = 0,
     ) -> Cell:
-        message = Cell()
-        message.bits.write_uint(2, 2)
-        message.bits.write_address(Address.from_any(src) if src else None)
-        message.bits.write_address(Address.from_any(dest))
-        message.bits.write_grams(import_fee)
-        return message
+        return cls._writable(
+            cls.EXTERNAL_MESSAGE_HEADER.encode(
+                src=Address.from_any(src) if src else None,
+                dest=Address.from_any(dest),
+                import_fee=import_fee,
+            )
+        )
 
     @classmethod
     def create_internal_message_header(
@@ -116,28 +178,28 @@ class Contract(abc.ABC):
         created_lt: int = 0,
         created_at: int = 0,
     ) -> Cell:
-        message = Cell()
-        message.bits.write_bit(0)
-        message.bits.write_bit(ihr_disabled)
-
-        if bounce is not None:
-            message.bits.write_bit(bounce)
-        else:
-            message.bits.write_bit(Address.from_any(dest).is_bounceable)
-        message.bits.write_bit(bounced)
-        message.bits.write_address(Address.from_any(src) if src else None)
-        message.bits.write_address(Address.from_any(dest))
-        message.bits.write_grams(grams)
+        dest = Address.from_any(dest)
+        if bounce is None:
+            bounce = dest.is_bounceable
         if currency_collection:
             # TODO: implement currency collections
             raise Exception("Currency collections are not implemented yet")
 
-        message.bits.write_bit(bool(currency_collection))
-        message.bits.write_grams(ihr_fees)
-        message.bits.write_grams(fwd_fees)
-        message.bits.write_uint(created_lt, 64)
-        message.bits.write_uint(created_at, 32)
-        return message
+        return cls._writable(
+            cls.INTERNAL_MESSAGE_HEADER.encode(
+                ihr_disabled=ihr_disabled,
+                bounce=bounce,
+                bounced=bounced,
+                src=Address.from_any(src) if src else None,
+                dest=dest,
+                value=grams,
+                extra=None,
+                ihr_fee=ihr_fees,
+                fwd_fee=fwd_fees,
+                created_lt=created_lt,
+                created_at=created_at,
+            )
+        )
 
     @classmethod
     def create_out_msg(
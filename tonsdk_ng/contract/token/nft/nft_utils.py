@@ -1,6 +1,6 @@
 import urllib.parse
 
-from ....boc import Cell
+from ....types import Cell
 
 SNAKE_DATA_PREFIX = 0x00
 CHUNK_DATA_PREFIX = 0x01
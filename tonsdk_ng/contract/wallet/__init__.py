@@ -1,3 +1,5 @@
+from collections.abc import Iterable
+from concurrent.futures import Executor
 from enum import Enum
 from typing import Any
 
@@ -9,6 +11,9 @@ from ...crypto import (
     private_key_to_public_key,
 )
 from ...crypto.exceptions import InvalidMnemonicsError
+from ...types import Address
+from ...utils import map_chunks, map_chunks_async
+from ._derive import derive_addresses, new_wallet_keys, wallet_keys
 from ._highload_query_id import HighloadQueryId
 from ._highload_wallet_contract_v2 import HighloadWalletV2Contract
 from ._highload_wallet_contract_v3 import HighloadWalletV3Contract
@@ -81,6 +86,121 @@ class Wallets:
             public_key=pub_k, private_key=priv_k, wc=workchain, **kwargs
         )
 
+    @classmethod
+    def create_many(
+        cls,
+        count: int,
+        version: WalletVersionEnum = default_version,
+        workchain: int = 0,
+        workers: int | None = None,
+        executor: Executor | None = None,
+        chunk_size: int = 4,
+        **kwargs: Any,
+    ) -> list[tuple[list[str], bytes, bytes, WalletContract]]:
+        """Same as calling create count times, but new mnemonics and their
+        keys are derived through map_chunks."""
+        keys = map_chunks(
+            new_wallet_keys, range(count), workers, executor, chunk_size
+        )
+        return cls._new_wallets(keys, version, workchain, **kwargs)
+
+    @classmethod
+    async def create_many_async(
+        cls,
+        count: int,
+        version: WalletVersionEnum = default_version,
+        workchain: int = 0,
+        workers: int | None = None,
+        executor: Executor | None = None,
+        chunk_size: int = 4,
+        **kwargs: Any,
+    ) -> list[tuple[list[str], bytes, bytes, WalletContract]]:
+        """Same as create_many, but does not block the event loop."""
+        keys = await map_chunks_async(
+            new_wallet_keys, range(count), workers, executor, chunk_size
+        )
+        return cls._new_wallets(keys, version, workchain, **kwargs)
+
+    @classmethod
+    def from_mnemonics_many(
+        cls,
+        mnemonics_list: Iterable[list[str]],
+        version: WalletVersionEnum = default_version,
+        workchain: int = 0,
+        workers: int | None = None,
+        executor: Executor | None = None,
+        chunk_size: int = 4,
+        **kwargs: Any,
+    ) -> list[WalletContract]:
+        """Same as calling from_mnemonics for every mnemonics, but the keys
+        are derived through map_chunks.
+
+        Raises InvalidMnemonicsError if any of the mnemonics is invalid."""
+        keys = map_chunks(
+            wallet_keys, mnemonics_list, workers, executor, chunk_size
+        )
+        return cls._restored_wallets(keys, version, workchain, **kwargs)
+
+    @classmethod
+    async def from_mnemonics_many_async(
+        cls,
+        mnemonics_list: Iterable[list[str]],
+        version: WalletVersionEnum = default_version,
+        workchain: int = 0,
+        workers: int | None = None,
+        executor: Executor | None = None,
+        chunk_size: int = 4,
+        **kwargs: Any,
+    ) -> list[WalletContract]:
+        """Same as from_mnemonics_many, but does not block the event
+        loop."""
+        keys = await map_chunks_async(
+            wallet_keys, mnemonics_list, workers, executor, chunk_size
+        )
+        return cls._restored_wallets(keys, version, workchain, **kwargs)
+
+    @classmethod
+    def _new_wallets(
+        cls,
+        keys: list[tuple[list[str], bytes, bytes]],
+        version: WalletVersionEnum,
+        workchain: int,
+        **kwargs: Any,
+    ) -> list[tuple[list[str], bytes, bytes, WalletContract]]:
+        wallet_class = cls.ALL[version]
+        return [
+            (
+                mnemonics,
+                pub_k,
+                priv_k,
+                wallet_class(
+                    public_key=pub_k, private_key=priv_k, wc=workchain, **kwargs
+                ),
+            )
+            for mnemonics, pub_k, priv_k in keys
+        ]
+
+    @classmethod
+    def _restored_wallets(
+        cls,
+        keys: list[tuple[bytes, bytes] | None],
+        version: WalletVersionEnum,
+        workchain: int,
+        **kwargs: Any,
+    ) -> list[WalletContract]:
+        wallet_class = cls.ALL[version]
+        wallets = []
+        for pair in keys:
+            if pair is None:
+                raise InvalidMnemonicsError()
+            pub_k, priv_k = pair
+            wallets.append(
+                wallet_class(
+                    public_key=pub_k, private_key=priv_k, wc=workchain, **kwargs
+                )
+            )
+        return wallets
+
     @classmethod
     def from_private_key(
         cls,
@@ -97,6 +217,37 @@ class Wallets:
             **kwargs,
         )
 
+    @classmethod
+    def derive_addresses(
+        cls,
+        version: WalletVersionEnum,
+        public_keys: Iterable[bytes],
+        wallet_id: int | None = None,
+        workchain: int = 0,
+        workers: int | None = None,
+        executor: Executor | None = None,
+        chunk_size: int = 4096,
+        **kwargs: Any,
+    ) -> list[Address]:
+        """Returns the addresses of the wallets of the version with the
+        public keys, in the input order.
+
+        Same as the addresses of the wallets created one by one, but the
+        code and the state init layout are hashed once and only the data
+        cells are built per key, in worker processes for large batches
+        (see derive_addresses)."""
+        if wallet_id is not None:
+            kwargs["wallet_id"] = wallet_id
+        return derive_addresses(
+            cls.ALL[version],
+            public_keys,
+            workchain,
+            workers,
+            executor,
+            chunk_size,
+            **kwargs,
+        )
+
     @classmethod
     def to_addr_pk(
         cls,
@@ -0,0 +1,108 @@
+import hashlib
+from collections.abc import Iterable
+from concurrent.futures import Executor
+from functools import partial
+from typing import Any
+
+from ...crypto import (
+    mnemonic_is_valid,
+    mnemonic_new,
+    mnemonic_to_wallet_key,
+)
+from ...types import Address
+from ...utils import map_chunks
+from ._wallet_contract import WalletContract
+
+
+def wallet_keys(
+    mnemonics_list: list[list[str]],
+) -> list[tuple[bytes, bytes] | None]:
+    """Returns the key pairs of the mnemonics, None for invalid ones."""
+    return [
+        (
+            mnemonic_to_wallet_key(mnemonics)
+            if mnemonic_is_valid(mnemonics)
+            else None
+        )
+        for mnemonics in mnemonics_list
+    ]
+
+
+def new_wallet_keys(items: list[Any]) -> list[tuple[list[str], bytes, bytes]]:
+    """Returns new mnemonics and their key pairs, one for every item."""
+    result = []
+    for _ in items:
+        mnemonics = mnemonic_new()
+        result.append((mnemonics, *mnemonic_to_wallet_key(mnemonics)))
+    return result
+
+
+def state_init_hashes(
+    wallet_class: type[WalletContract],
+    options: dict[str, Any],
+    head: bytes,
+    code_hash: bytes,
+    public_keys: list[bytes],
+) -> list[bytes]:
+    """Returns the state init hashes of the wallets with the public keys.
+
+    head is the state init representation up to the data depth: its
+    descriptors, bits and the code depth. One wallet is built for the
+    chunk, only its data cell is rebuilt and hashed for every key."""
+    # the private key is not needed to build the data cell
+    wallet = wallet_class(public_key=bytes(32), private_key=None, **options)
+    hashes = []
+    for public_key in public_keys:
+        wallet.options["public_key"] = public_key
+        data = wallet.create_data_cell().get_info()
+        hashes.append(
+            hashlib.sha256(
+                head + data.depth.to_bytes(2, "big") + code_hash + data.hash
+            ).digest()
+        )
+    return hashes
+
+
+def derive_addresses(
+    wallet_class: type[WalletContract],
+    public_keys: Iterable[bytes],
+    workchain: int = 0,
+    workers: int | None = None,
+    executor: Executor | None = None,
+    chunk_size: int = 4096,
+    **kwargs: Any,
+) -> list[Address]:
+    """Returns the addresses of the wallets with the public keys in the
+    input order, other options of the wallets are the same. Runs through
+    map_chunks."""
+    keys = list(public_keys)
+    options = dict(kwargs, wc=workchain)
+    # wallets of a class differ only in their data cells, the state init of
+    # any of them gives the common part of the representation and checks
+    # the options
+    template = wallet_class(public_key=bytes(32), private_key=None, **options)
+    state_init = template.create_state_init()
+    code = state_init["code"].get_info()
+    head = state_init["state_init"].get_info().data
+    task = partial(
+        state_init_hashes,
+        wallet_class,
+        options,
+        head + code.depth.to_bytes(2, "big"),
+        code.hash,
+    )
+
+    hashes = map_chunks(task, keys, workers, executor, chunk_size)
+
+    wc = template.options["wc"]
+    return [
+        Address(
+            wc=wc,
+            hash_part=hash_part,
+            is_user_friendly=False,
+            is_url_safe=False,
+            is_bounceable=False,
+            is_test_only=False,
+        )
+        for hash_part in hashes
+    ]
@@ -1,8 +1,10 @@
 import time
+from collections.abc import Iterable
+from concurrent.futures import Executor
 from decimal import Decimal
 
 from tonsdk_ng.types import Address, Cell, begin_cell, begin_dict
-from tonsdk_ng.utils import sign_message
+from tonsdk_ng.utils import sign_detached, sign_many
 
 from .. import Contract
 from ._wallet_contract import WalletContract
@@ -25,10 +27,10 @@ class HighloadWalletContractBase(WalletContract):
 
 
 class HighloadWalletV2Contract(HighloadWalletContractBase):
+    # https://github.com/akifoq/highload-wallet/blob/master/highload-wallet-v2-code.fc
+    code = "B5EE9C720101090100E5000114FF00F4A413F4BCF2C80B010201200203020148040501EAF28308D71820D31FD33FF823AA1F5320B9F263ED44D0D31FD33FD3FFF404D153608040F40E6FA131F2605173BAF2A207F901541087F910F2A302F404D1F8007F8E16218010F4786FA5209802D307D43001FB009132E201B3E65B8325A1C840348040F4438AE63101C8CB1F13CB3FCBFFF400C9ED54080004D03002012006070017BD9CE76A26869AF98EB85FFC0041BE5F976A268698F98E99FE9FF98FA0268A91040207A0737D098C92DBFC95DD1F140034208040F4966FA56C122094305303B9DE2093333601926C21E2B3"  # noqa: E501
+
     def __init__(self, **kwargs) -> None:
-        # https://github.com/akifoq/highload-wallet/blob/master/highload-wallet-v2-code.fc
-        self.code = "B5EE9C720101090100E5000114FF00F4A413F4BCF2C80B010201200203020148040501EAF28308D71820D31FD33FF823AA1F5320B9F263ED44D0D31FD33FD3FFF404D153608040F40E6FA131F2605173BAF2A207F901541087F910F2A302F404D1F8007F8E16218010F4786FA5209802D307D43001FB009132E201B3E65B8325A1C840348040F4438AE63101C8CB1F13CB3FCBFFF400C9ED54080004D03002012006070017BD9CE76A26869AF98EB85FFC0041BE5F976A268698F98E99FE9FF98FA0268A91040207A0737D098C92DBFC95DD1F140034208040F4966FA56C122094305303B9DE2093333601926C21E2B3"  # noqa: E501
-        kwargs["code"] = Cell.one_from_boc(self.code)
         super().__init__(**kwargs)
         if "wallet_id" not in kwargs:
             self.options["wallet_id"] = 698983191 + self.options["wc"]
@@ -40,6 +42,50 @@ class HighloadWalletV2Contract(HighloadWalletContractBase):
         timeout=60,
         dummy_signature=False,
     ):
+        signing_message = self.create_transfer_signing_message(
+            recipients_list, query_id, timeout
+        )
+        return self.create_external_message(signing_message, dummy_signature)
+
+    def create_transfer_messages_many(  # type: ignore[override]
+        self,
+        jobs: Iterable[tuple[int, list]],
+        timeout=60,
+        workers: int | None = None,
+        executor: Executor | None = None,
+        chunk_size: int = 256,
+    ) -> list[bytes]:
+        """Returns BOCs of the external messages for (query_id,
+        recipients_list) jobs, the same as of create_transfer_message(
+        recipients_list, query_id, timeout)["message"] for every job.
+
+        All signing messages are built and hashed first, then signed
+        through sign_many. Payload cells of the jobs are not modified."""
+        signing_messages = [
+            self.create_transfer_signing_message(recipients, query_id, timeout)
+            for query_id, recipients in jobs
+        ]
+        header = Contract.create_external_message_header(self.address)
+        signatures = sign_many(
+            # frozen messages keep their hashes for serialization
+            [message.bytes_hash() for message in signing_messages],
+            self.options["private_key"],
+            workers,
+            executor,
+            chunk_size,
+        )
+        return [
+            self.create_signed_external_message(message, signature, header)[
+                "message"
+            ].to_boc(False)
+            for message, signature in zip(
+                signing_messages, signatures, strict=True
+            )
+        ]
+
+    def create_transfer_signing_message(  # type: ignore[override]
+        self, recipients_list: list, query_id: int, timeout=60
+    ) -> Cell:
         if query_id < (t := int(time.time() + timeout) << 32):
             query_id = t + query_id
 
@@ -53,7 +99,8 @@ class HighloadWalletV2Contract(HighloadWalletContractBase):
                         payload_cell.bits.write_uint(0, 32)
                         payload_cell.bits.write_string(recipient["payload"])
                 elif hasattr(recipient["payload"], "refs"):
-                    payload_cell = recipient["payload"]
+                    # the signing message is frozen, the payload is not
+                    payload_cell = recipient["payload"].frozen_copy()
                 else:
                     payload_cell.bits.write_bytes(recipient["payload"])
 
@@ -61,8 +108,11 @@ class HighloadWalletV2Contract(HighloadWalletContractBase):
                 Address.from_any(recipient["address"]),
                 Decimal(recipient["amount"]),
             )
+            state_init = recipient.get("state_init")
             order = Contract.create_common_msg_info(
-                order_header, recipient.get("state_init"), payload_cell
+                order_header,
+                state_init.frozen_copy() if state_init else None,
+                payload_cell,
             )
             recipients.store_cell(
                 i,
@@ -73,26 +123,32 @@ class HighloadWalletV2Contract(HighloadWalletContractBase):
             )
 
         signing_message.store_maybe_ref(recipients.end_cell())
-        return self.create_external_message(
-            signing_message.end_cell(), dummy_signature
-        )
+        return signing_message.end_cell()
 
     def create_external_message(self, signing_message, dummy_signature=False):
         signature = (
             bytes(64)
             if dummy_signature
-            else sign_message(
-                bytes(signing_message.bytes_hash()), self.options["private_key"]
-            ).signature
+            else sign_detached(
+                signing_message.bytes_hash(), self.options["private_key"]
+            )
         )
+        return self.create_signed_external_message(signing_message, signature)
 
+    def create_signed_external_message(  # type: ignore[override]
+        self,
+        signing_message: Cell,
+        signature: bytes,
+        header: Cell | None = None,
+    ):
         body = Cell()
         body.bits.write_bytes(signature)
         body.write_cell(signing_message)
 
         state_init = code = data = None
         self_address = self.address
-        header = Contract.create_external_message_header(self_address)
+        if header is None:
+            header = Contract.create_external_message_header(self_address)
         result_message = Contract.create_common_msg_info(
             header, state_init, body
         )
@@ -121,9 +177,9 @@ class HighloadWalletV2Contract(HighloadWalletContractBase):
             .store_maybe_ref(None)
             .end_cell()
         )
-        signature = sign_message(
-            bytes(signing_message.bytes_hash()), self.options["private_key"]
-        ).signature
+        signature = sign_detached(
+            signing_message.bytes_hash(), self.options["private_key"]
+        )
 
         body = Cell()
         body.bits.write_bytes(signature)
@@ -1,8 +1,10 @@
+from collections.abc import Iterable
+from concurrent.futures import Executor
 from enum import Enum
 from typing import Any, TypedDict
 
 from ...types import Address, Cell
-from ...utils import sign_message
+from ...utils import sign_detached, sign_many
 from .. import Contract
 
 
@@ -96,6 +98,59 @@ class WalletContract(Contract):
         send_mode: int = DEFAULT_SEND_MODE,
         dummy_signature: bool = False,
     ) -> ExternalMessage:
+        signing_message = self.create_transfer_signing_message(
+            seqno, messages, send_mode
+        )
+        return self.create_external_message(
+            signing_message, seqno, dummy_signature
+        )
+
+    def create_transfer_messages_many(
+        self,
+        jobs: Iterable[tuple[int, list[dict[str, Any]]]],
+        send_mode: int = DEFAULT_SEND_MODE,
+        workers: int | None = None,
+        executor: Executor | None = None,
+        chunk_size: int = 256,
+    ) -> list[bytes]:
+        """Returns BOCs of the external messages for (seqno, messages)
+        jobs, the same as of create_transfer_messages(seqno, messages,
+        send_mode)["message"] for every job.
+
+        All signing messages are built and hashed first, then signed
+        through sign_many. Payload cells of the jobs are not modified."""
+        jobs = list(jobs)
+        # copies leave the payload cells of the jobs unfrozen
+        signing_messages = [
+            self.create_transfer_signing_message(
+                seqno, messages, send_mode
+            ).frozen_copy()
+            for seqno, messages in jobs
+        ]
+        header = Contract.create_external_message_header(self.address)
+        signatures = sign_many(
+            # frozen messages keep their hashes for serialization
+            [message.bytes_hash() for message in signing_messages],
+            self.options["private_key"],
+            workers,
+            executor,
+            chunk_size,
+        )
+        return [
+            self.create_signed_external_message(
+                message, signature, seqno, header
+            )["message"].to_boc(False)
+            for (seqno, _), message, signature in zip(
+                jobs, signing_messages, signatures, strict=True
+            )
+        ]
+
+    def create_transfer_signing_message(
+        self,
+        seqno: int,
+        messages: list[dict[str, Any]],
+        send_mode: int = DEFAULT_SEND_MODE,
+    ) -> Cell:
         if seqno < 0:
             raise ValueError("seqno must be integer >= 0")
         if not (1 <= len(messages) <= 4):
@@ -112,9 +167,7 @@ class WalletContract(Contract):
                     msg.get("state_init"),
                 )
             )
-        return self.create_external_message(
-            signing_message, seqno, dummy_signature
-        )
+        return signing_message
 
     def create_external_message(
         self, signing_message: Cell, seqno: int, dummy_signature: bool = False
@@ -122,11 +175,23 @@ class WalletContract(Contract):
         signature = (
             bytes(64)
             if dummy_signature
-            else sign_message(
-                bytes(signing_message.bytes_hash()), self.options["private_key"]
-            ).signature
+            else sign_detached(
+                signing_message.bytes_hash(), self.options["private_key"]
+            )
+        )
+        return self.create_signed_external_message(
+            signing_message, signature, seqno
         )
 
+    def create_signed_external_message(
+        self,
+        signing_message: Cell,
+        signature: bytes,
+        seqno: int,
+        header: Cell | None = None,
+    ) -> ExternalMessage:
+        """Assembles the external message from the signing message and its
+        signature. The header may be shared by messages to the wallet."""
         body = Cell()
         body.bits.write_bytes(signature)
         body.write_cell(signing_message)
@@ -140,7 +205,8 @@ class WalletContract(Contract):
             data = deploy["data"]
 
         self_address = self.address
-        header = Contract.create_external_message_header(self_address)
+        if header is None:
+            header = Contract.create_external_message_header(self_address)
         result_message = Contract.create_common_msg_info(
             header, state_init, body
         )
@@ -164,9 +230,9 @@ class WalletContract(Contract):
         data = create_state_init["data"]
 
         signing_message = self.create_signing_message()
-        signature = sign_message(
-            bytes(signing_message.bytes_hash()), self.options["private_key"]
-        ).signature
+        signature = sign_detached(
+            signing_message.bytes_hash(), self.options["private_key"]
+        )
 
         body = Cell()
         body.bits.write_bytes(signature)
@@ -20,14 +20,8 @@ class WalletV2ContractBase(WalletContract):
 
 
 class WalletV2ContractR1(WalletV2ContractBase):
-    def __init__(self, **kwargs) -> None:
-        self.code = "B5EE9C724101010100570000AAFF0020DD2082014C97BA9730ED44D0D70B1FE0A4F2608308D71820D31FD31F01F823BBF263ED44D0D31FD3FFD15131BAF2A103F901541042F910F2A2F800029320D74A96D307D402FB00E8D1A4C8CB1FCBFFC9ED54A1370BB6"  # noqa: E501
-        kwargs["code"] = Cell.one_from_boc(self.code)
-        super().__init__(**kwargs)
+    code = "B5EE9C724101010100570000AAFF0020DD2082014C97BA9730ED44D0D70B1FE0A4F2608308D71820D31FD31F01F823BBF263ED44D0D31FD3FFD15131BAF2A103F901541042F910F2A2F800029320D74A96D307D402FB00E8D1A4C8CB1FCBFFC9ED54A1370BB6"  # noqa: E501
 
 
 class WalletV2ContractR2(WalletV2ContractBase):
-    def __init__(self, **kwargs) -> None:
-        self.code = "B5EE9C724101010100630000C2FF0020DD2082014C97BA218201339CBAB19C71B0ED44D0D31FD70BFFE304E0A4F2608308D71820D31FD31F01F823BBF263ED44D0D31FD3FFD15131BAF2A103F901541042F910F2A2F800029320D74A96D307D402FB00E8D1A4C8CB1FCBFFC9ED54044CD7A1"  # noqa: E501
-        kwargs["code"] = Cell.one_from_boc(self.code)
-        super().__init__(**kwargs)
+    code = "B5EE9C724101010100630000C2FF0020DD2082014C97BA218201339CBAB19C71B0ED44D0D31FD70BFFE304E0A4F2608308D71820D31FD31F01F823BBF263ED44D0D31FD3FFD15131BAF2A103F901541042F910F2A2F800029320D74A96D307D402FB00E8D1A4C8CB1FCBFFC9ED54044CD7A1"  # noqa: E501
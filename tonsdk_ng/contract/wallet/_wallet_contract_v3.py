@@ -28,18 +28,18 @@ class WalletV3ContractBase(WalletContract):
 
 
 class WalletV3ContractR1(WalletV3ContractBase):
+    code = "B5EE9C724101010100620000C0FF0020DD2082014C97BA9730ED44D0D70B1FE0A4F2608308D71820D31FD31FD31FF82313BBF263ED44D0D31FD31FD3FFD15132BAF2A15144BAF2A204F901541055F910F2A3F8009320D74A96D307D402FB00E8D101A4C8CB1FCB1FCBFFC9ED543FBE6EE0"  # noqa: E501
+
     def __init__(self, **kwargs) -> None:
-        self.code = "B5EE9C724101010100620000C0FF0020DD2082014C97BA9730ED44D0D70B1FE0A4F2608308D71820D31FD31FD31FF82313BBF263ED44D0D31FD31FD3FFD15132BAF2A15144BAF2A204F901541055F910F2A3F8009320D74A96D307D402FB00E8D101A4C8CB1FCB1FCBFFC9ED543FBE6EE0"  # noqa: E501
-        kwargs["code"] = Cell.one_from_boc(self.code)
         super().__init__(**kwargs)
         if "wallet_id" not in kwargs:
             self.options["wallet_id"] = 698983191 + self.options["wc"]
 
 
 class WalletV3ContractR2(WalletV3ContractBase):
+    code = "B5EE9C724101010100710000DEFF0020DD2082014C97BA218201339CBAB19F71B0ED44D0D31FD31F31D70BFFE304E0A4F2608308D71820D31FD31FD31FF82313BBF263ED44D0D31FD31FD3FFD15132BAF2A15144BAF2A204F901541055F910F2A3F8009320D74A96D307D402FB00E8D101A4C8CB1FCB1FCBFFC9ED5410BD6DAD"  # noqa: E501
+
     def __init__(self, **kwargs) -> None:
-        self.code = "B5EE9C724101010100710000DEFF0020DD2082014C97BA218201339CBAB19F71B0ED44D0D31FD31F31D70BFFE304E0A4F2608308D71820D31FD31FD31FF82313BBF263ED44D0D31FD31FD3FFD15132BAF2A15144BAF2A204F901541055F910F2A3F8009320D74A96D307D402FB00E8D101A4C8CB1FCB1FCBFFC9ED5410BD6DAD"  # noqa: E501
-        kwargs["code"] = Cell.one_from_boc(self.code)
         super().__init__(**kwargs)
         if "wallet_id" not in kwargs:
             self.options["wallet_id"] = 698983191 + self.options["wc"]
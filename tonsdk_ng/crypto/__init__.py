@@ -3,6 +3,7 @@ from ._mnemonic import (
     mnemonic_from_password,
     mnemonic_is_valid,
     mnemonic_new,
+    mnemonic_new_many,
     mnemonic_to_wallet_key,
 )
 from ._utils import private_key_to_public_key, verify_sign
@@ -14,6 +15,7 @@ __all__ = [
     "mnemonic_from_password",
     "mnemonic_is_valid",
     "mnemonic_new",
+    "mnemonic_new_many",
     "mnemonic_to_wallet_key",
     "private_key_to_public_key",
     "verify_sign",
@@ -1,13 +1,21 @@
 import hashlib
 import hmac
+import os
 import random
+from concurrent.futures import Executor
+from functools import partial
 
 from nacl.bindings import crypto_sign_seed_keypair
 
+from ..utils import map_chunks
 from ._settings import PBKDF_ITERATIONS
-from ._utils import get_secure_random_number, is_basic_seed
+from ._utils import is_basic_seed
 from .bip39 import english
 
+# one of 256 random phrases is a valid seed on average, candidates are
+# drawn from the system by this many phrases at once
+CANDIDATES_PER_DRAW = 256
+
 
 def mnemonic_is_valid(mnemo_words: list[str]) -> bool:
     return len(mnemo_words) == 24 and is_basic_seed(
@@ -36,19 +44,58 @@ def mnemonic_to_wallet_key(mnemo_words: list[str]) -> tuple[bytes, bytes]:
     return crypto_sign_seed_keypair(priv_k[:32])
 
 
-def mnemonic_new(words_count: int = 24) -> list[str]:
-    while True:
-        mnemo_arr = []
+def random_phrases(count: int, words_count: int) -> list[list[str]]:
+    """Draws count random phrases with a single os.urandom call.
 
-        for _ in range(words_count):
-            idx = get_secure_random_number(0, len(english))
-            mnemo_arr.append(english[idx])
+    The word list has 2048 words, so the low 11 bits of a random 16-bit
+    number pick a word uniformly."""
+    numbers = memoryview(os.urandom(2 * count * words_count)).cast("H")
+    words = [english[number & 0x7FF] for number in numbers]
+    return [
+        words[start : start + words_count]
+        for start in range(0, len(words), words_count)
+    ]
 
-        if not is_basic_seed(mnemonic_to_entropy(mnemo_arr)):
-            continue
 
-        break
-    return mnemo_arr
+def find_mnemonics(count: int, words_count: int) -> list[list[str]]:
+    """Returns count random phrases which are valid basic seeds."""
+    found: list[list[str]] = []
+    while len(found) < count:
+        for phrase in random_phrases(CANDIDATES_PER_DRAW, words_count):
+            if is_basic_seed(mnemonic_to_entropy(phrase)):
+                found.append(phrase)
+                if len(found) == count:
+                    break
+    return found
+
+
+def _new_mnemonics(words_count: int, items: list[int]) -> list[list[str]]:
+    return find_mnemonics(len(items), words_count)
+
+
+def mnemonic_new(words_count: int = 24) -> list[str]:
+    return find_mnemonics(1, words_count)[0]
+
+
+def mnemonic_new_many(
+    count: int,
+    words_count: int = 24,
+    workers: int | None = None,
+    executor: Executor | None = None,
+    chunk_size: int = 16,
+) -> list[list[str]]:
+    """Returns count new mnemonics, same as calling mnemonic_new count
+    times.
+
+    Every valid phrase takes a few hundred candidates on average, they are
+    searched for through map_chunks."""
+    return map_chunks(
+        partial(_new_mnemonics, words_count),
+        range(count),
+        workers,
+        executor,
+        chunk_size,
+    )
 
 
 def mnemonic_from_password(password: str, words_count: int = 24) -> list[str]:
@@ -20,7 +20,7 @@ def get_secure_random_number(min_v: int, max_v: int) -> int:
     mask = math.pow(2, bits_needed) - 1
 
     while True:
-        res = os.urandom(bits_needed)
+        res = os.urandom(bytes_needed)
         power = (bytes_needed - 1) * 8
         number_val = 0
         for i in range(bytes_needed):
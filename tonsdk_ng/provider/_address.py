@@ -1,5 +1,7 @@
 import base64
 
+from tonsdk_ng.utils import crc16
+
 bounceable_tag, non_bounceable_tag = b"\x11", b"\x51"
 b64_abc = set(
     "abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ1234567890+/"
@@ -25,23 +27,6 @@ def is_hex(x):
         return False
 
 
-def calcCRC(message):
-    poly = 0x1021
-    reg = 0
-    message += b"\x00\x00"
-    for byte in message:
-        mask = 0x80
-        while mask > 0:
-            reg <<= 1
-            if byte & mask:
-                reg += 1
-            mask >>= 1
-            if reg > 0xFFFF:
-                reg &= 0xFFFF
-                reg ^= poly
-    return reg.to_bytes(2, "big")
-
-
 def account_forms(raw_form, test_only=False):
     workchain, address = raw_form.split(":")
     workchain, address = int(workchain), int(address, 16)
@@ -54,12 +39,12 @@ def account_forms(raw_form, test_only=False):
     #  nbtag = (nbtag[0] | 0x80).to_bytes(1,'big')
     preaddr_b = btag + workchain_tag + address
     preaddr_u = nbtag + workchain_tag + address
-    b64_b = base64.b64encode(preaddr_b + calcCRC(preaddr_b)).decode("utf8")
-    b64_u = base64.b64encode(preaddr_u + calcCRC(preaddr_u)).decode("utf8")
-    b64_b_us = base64.urlsafe_b64encode(preaddr_b + calcCRC(preaddr_b)).decode(
+    b64_b = base64.b64encode(preaddr_b + crc16(preaddr_b)).decode("utf8")
+    b64_u = base64.b64encode(preaddr_u + crc16(preaddr_u)).decode("utf8")
+    b64_b_us = base64.urlsafe_b64encode(preaddr_b + crc16(preaddr_b)).decode(
         "utf8"
     )
-    b64_u_us = base64.urlsafe_b64encode(preaddr_u + calcCRC(preaddr_u)).decode(
+    b64_u_us = base64.urlsafe_b64encode(preaddr_u + crc16(preaddr_u)).decode(
         "utf8"
     )
     return {
@@ -78,7 +63,7 @@ def read_friendly_address(address):
         address_bytes = base64.urlsafe_b64decode(address.encode("utf8"))
     else:
         raise Exception("Not an address")
-    if not calcCRC(address_bytes[:-2]) == address_bytes[-2:]:
+    if not crc16(address_bytes[:-2]) == address_bytes[-2:]:
         raise Exception("Wrong checksum")
     tag = address_bytes[0]
     if tag & 0x80:
@@ -1,17 +1,55 @@
 from ._address import Address
 from ._builder import Builder, begin_cell
-from ._cell import Cell
+from ._bulk import parse_bocs
+from ._cell import (
+    Cell,
+    CellType,
+    from_boc_multi_root,
+    to_boc_multi_root,
+    write_boc_multi_root,
+)
+from ._dict import DictReader, PersistentDict, parse_dict
 from ._dict_builder import DictBuilder, begin_dict
+from ._intern import (
+    CellStore,
+    disable_cell_interning,
+    enable_cell_interning,
+    get_cell_store,
+)
+from ._proof import (
+    check_merkle_proof,
+    create_library_cell,
+    create_merkle_proof,
+    create_pruned_branch,
+)
 from ._slice import Slice
+from ._tlb import TLBConstructor
 
 __all__ = [
     "Address",
     "Cell",
+    "CellType",
+    "CellStore",
+    "enable_cell_interning",
+    "disable_cell_interning",
+    "get_cell_store",
+    "from_boc_multi_root",
+    "to_boc_multi_root",
+    "write_boc_multi_root",
+    "parse_bocs",
+    "check_merkle_proof",
+    "create_library_cell",
+    "create_merkle_proof",
+    "create_pruned_branch",
     "Slice",
+    "TLBConstructor",
     "Builder",
     "begin_cell",
     "DictBuilder",
     "begin_dict",
+    "DictReader",
+    "parse_dict",
+    "PersistentDict",
     "deserialize_cell_data",
     "parse_boc_header",
 ]
@@ -1,8 +1,9 @@
 import base64
+from collections.abc import Iterable
 from typing import NamedTuple, Union, Optional
 
 from tonsdk_ng.exceptions import InvalidAddressError
-from tonsdk_ng.utils import bytes_to_b64str, crc16
+from tonsdk_ng.utils import bytes_to_b64str, crc16, crc16_many
 
 from ._cell import Cell
 
@@ -133,6 +134,45 @@ class Address:
         if not is_user_friendly:
             return f"{self.wc}:{self.hash_part.hex()}"
 
+        addr = self._friendly_payload(is_bounceable, is_test_only)
+        return _encode_friendly(addr + crc16(addr), is_url_safe)
+
+    @staticmethod
+    def many_to_string(
+        addresses: Iterable["Address"],
+        is_user_friendly: bool | None = None,
+        is_url_safe: bool | None = None,
+        is_bounceable: bool | None = None,
+        is_test_only: bool | None = None,
+    ) -> list[str]:
+        """Same as calling to_string on every address, but checksums all
+        user-friendly forms in one batch."""
+        result: list[str] = []
+        friendly: list[tuple[int, bytes, bool]] = []
+        for addr in addresses:
+            if not (
+                addr.is_user_friendly
+                if is_user_friendly is None
+                else is_user_friendly
+            ):
+                result.append(f"{addr.wc}:{addr.hash_part.hex()}")
+                continue
+            payload = addr._friendly_payload(
+                addr.is_bounceable if is_bounceable is None else is_bounceable,
+                addr.is_test_only if is_test_only is None else is_test_only,
+            )
+            url_safe = addr.is_url_safe if is_url_safe is None else is_url_safe
+            friendly.append((len(result), payload, url_safe))
+            result.append("")
+
+        crcs = crc16_many(payload for _, payload, _ in friendly)
+        for (i, payload, url_safe), crc in zip(friendly, crcs, strict=True):
+            result[i] = _encode_friendly(payload + crc, url_safe)
+        return result
+
+    def _friendly_payload(
+        self, is_bounceable: bool, is_test_only: bool
+    ) -> bytes:
         tag = (
             Address.BOUNCEABLE_TAG
             if is_bounceable
@@ -140,27 +180,19 @@ class Address:
         )
         if is_test_only:
             tag |= Address.TEST_FLAG
-
-        addr = bytearray(34)
-        addr[0] = tag
-        addr[1] = self.wc
-        addr[2:] = self.hash_part
-        address_with_checksum = bytearray(36)
-        address_with_checksum[:34] = addr
-        address_with_checksum[34:] = crc16(addr)
-
-        address_base_64 = bytes_to_b64str(address_with_checksum)
-        if is_url_safe:
-            address_base_64 = address_base_64.replace("+", "-").replace(
-                "/", "_"
-            )
-
-        return address_base_64
+        return bytes((tag, self.wc & 0xFF)) + self.hash_part
 
     def to_buffer(self) -> bytes:
         return self.hash_part + bytearray([self.wc, self.wc, self.wc, self.wc])
 
 
+def _encode_friendly(address_with_checksum: bytes, is_url_safe: bool) -> str:
+    address_base_64 = bytes_to_b64str(address_with_checksum)
+    if is_url_safe:
+        address_base_64 = address_base_64.replace("+", "-").replace("/", "_")
+    return address_base_64
+
+
 class ParseResult(NamedTuple):
     is_test_only: bool
     is_bounceable: bool
@@ -1,6 +1,5 @@
 from __future__ import annotations
 
-import copy
 import math
 from collections.abc import Iterator
 from typing import TYPE_CHECKING
@@ -14,6 +13,7 @@ class BitString:
         self.array = bytearray(math.ceil(length / 8))
         self.cursor = 0
         self.length = length
+        self.frozen = False
 
     def __repr__(self) -> str:
         return str(self.get_top_upped_array())
@@ -47,11 +47,13 @@ class BitString:
 
     def off(self, n: int) -> None:
         """Sets next from cursor n bits to 0. Does not move cursor."""
+        self.check_frozen()
         self.check_range(n)
         self.array[(n // 8) | 0] &= ~(1 << (7 - (n % 8)))
 
     def on(self, n: int) -> None:
         """Sets next from cursor n bits to 1. Does not move cursor."""
+        self.check_frozen()
         self.check_range(n)
         self.array[(n // 8) | 0] |= 1 << (7 - (n % 8))
 
@@ -60,9 +62,27 @@ class BitString:
         if n > self.length:
             raise Exception("BitString overflow")
 
+    def check_frozen(self) -> None:
+        """Throws an exception if the BitString was frozen."""
+        if self.frozen:
+            raise Exception("BitString is frozen")
+
+    def freeze(self) -> None:
+        """Makes the BitString read-only. Used by frozen cells."""
+        self.frozen = True
+
+    def copy(self) -> BitString:
+        """Returns a writable copy of the BitString."""
+        ret = BitString(0)
+        ret.array = bytearray(self.array)
+        ret.cursor = self.cursor
+        ret.length = self.length
+        return ret
+
     def set_top_upped_array(
         self, array: bytearray, fullfilled_bytes: bool = True
     ) -> None:
+        self.check_frozen()
         self.length = len(array) * 8
         self.array = array
         self.cursor = self.length
@@ -86,16 +106,13 @@ class BitString:
                 )
 
     def get_top_upped_array(self) -> bytearray:
-        ret = copy.deepcopy(self)
-        tu = math.ceil(ret.cursor / 8) * 8 - ret.cursor
+        size = math.ceil(self.cursor / 8)
+        ret = self.array[:size]
+        tu = size * 8 - self.cursor
         if tu > 0:
-            tu -= 1
-            ret.write_bit(1)
-            while tu > 0:
-                tu -= 1
-                ret.write_bit(0)
-        ret.array = ret.array[: math.ceil(ret.cursor / 8)]
-        return ret.array
+            # completion tag: a single 1 bit followed by zeros
+            ret[-1] = (ret[-1] & (0xFF << tu) & 0xFF) | (1 << (tu - 1))
+        return ret
 
     def get_free_bits(self) -> int:
         """Returns the number of not used bits in the BitString."""
@@ -121,7 +138,7 @@ class BitString:
         self.cursor += 1
 
     def write_uint(self, number: int, bit_length: int) -> None:
-        if bit_length == 0 or len(f"{number:b}") > bit_length:
+        if bit_length <= 0 or number.bit_length() > bit_length:
             if number == 0:
                 return
 
@@ -129,68 +146,99 @@ class BitString:
                 "bitLength is too small for number, got"
                 f" number={number},bitLength={bit_length}"
             )
+        if number < 0:
+            raise ValueError(f"Can not write negative number={number} as uint")
 
-        for i in range(bit_length, 0, -1):
-            k = 2 ** (i - 1)
-            if number // k == 1:
-                self.write_bit(1)
-                number -= k
-            else:
-                self.write_bit(0)
+        self.write_bits(number, bit_length)
 
     def write_uint8(self, ui8: int) -> None:
         """Just as write_uint(n, 8), but only write_uint8(n) (?)."""
         self.write_uint(ui8, 8)
 
     def write_int(self, number: int, bit_length: int) -> None:
-        if bit_length == 1:
-            if number == -1:
-                self.write_bit(1)
-                return
+        if bit_length <= 0 or not (
+            -(1 << (bit_length - 1)) <= number < (1 << (bit_length - 1))
+        ):
+            raise ValueError(
+                "bitLength is too small for number, got"
+                f" number={number},bitLength={bit_length}"
+            )
 
-            if number == 0:
-                self.write_bit(0)
-                return
+        # two's complement
+        self.write_bits(number & ((1 << bit_length) - 1), bit_length)
 
-            raise Exception("Bitlength is too small for number")
-        else:
-            if number < 0:
-                self.write_bit(1)
-                s = 2 ** (bit_length - 1)
-                self.write_uint(s + number, bit_length - 1)
-            else:
-                self.write_bit(0)
-                self.write_uint(number, bit_length - 1)
+    def write_bits(self, value: int, n: int) -> None:
+        """Writes the n low bits of a non-negative value at the cursor.
+
+        Unlike write_uint, the value is not checked, higher bits should
+        be masked out by the caller."""
+        self.check_frozen()
+        cursor = self.cursor
+        end = cursor + n
+        if end > self.length:
+            raise Exception("BitString overflow")
+
+        first, last = cursor >> 3, (end + 7) >> 3
+        pad = (last << 3) - end  # bits after the value in the last byte
+        if cursor & 7 or pad:
+            # keep the bits around the value in the partial bytes
+            window = int.from_bytes(self.array[first:last], "big")
+            span = (last - first) << 3
+            keep = ((1 << span) - 1) ^ (((1 << n) - 1) << pad)
+            value = (window & keep) | (value << pad)
+        self.array[first:last] = value.to_bytes(last - first, "big")
+        self.cursor = end
 
     def write_string(self, value: str) -> None:
         self.write_bytes(bytes(value, encoding="utf-8"))
 
-    def write_bytes(self, ui8_array: bytes) -> None:
-        for ui8 in ui8_array:
-            self.write_uint8(ui8)
+    def write_bytes(self, ui8_array: bytes | bytearray | memoryview) -> None:
+        self._write_bit_run(ui8_array, len(ui8_array) * 8)
 
     def write_bit_string(self, another_bit_string: "BitString") -> None:
-        for bit in another_bit_string:
-            self.write_bit(bit)
+        self._write_bit_run(another_bit_string.array, another_bit_string.cursor)
+
+    def _write_bit_run(
+        self, data: bytes | bytearray | memoryview, n: int
+    ) -> None:
+        """Writes the first n bits of data at the cursor."""
+        if self.cursor & 7 or n & 7:
+            # shift the run into place and merge it with the partial bytes
+            size = (n + 7) >> 3
+            value = int.from_bytes(data[:size], "big") >> ((size << 3) - n)
+            self.write_bits(value, n)
+            return
+
+        self.check_frozen()
+        first, last = self.cursor >> 3, (self.cursor + n) >> 3
+        if last << 3 > self.length:
+            raise Exception("BitString overflow")
+        self.array[first:last] = data[: last - first]
+        self.cursor += n
 
     def write_address(self, address: Address | None) -> None:
         """Writes an address, maybe zero-address (None) to the BitString."""
         if address is None:
             self.write_uint(0, 2)
         else:
-            self.write_uint(2, 2)
-            self.write_uint(0, 1)  # anycast
-            self.write_int(address.wc, 8)
-            self.write_bytes(address.hash_part)
+            if not -128 <= address.wc < 128:
+                raise ValueError(f"Invalid address wc {address.wc}")
+            # addr_std$10 anycast:(Maybe Anycast) workchain_id:int8
+            header = (0b100 << 8) | (address.wc & 0xFF)
+            size = len(address.hash_part) * 8
+            value = int.from_bytes(address.hash_part, "big")
+            self.write_bits((header << size) | value, 11 + size)
 
     def write_grams(self, amount: int) -> None:
-        if amount == 0:
-            self.write_uint(0, 4)
-        else:
-            amount = int(amount)
-            sz = math.ceil(len(hex(amount)[2:]) / 2)  # ? [2:] removes 0x
-            self.write_uint(sz, 4)
-            self.write_uint(amount, sz * 8)
+        amount = int(amount)
+        if amount < 0:
+            raise ValueError(f"Can not write negative amount={amount}")
+
+        # var_uint$_ {n:#} len:(#< n) value:(uint (len * 8))
+        sz = (amount.bit_length() + 7) // 8
+        if sz >= 16:
+            raise ValueError(f"Amount is too big, got amount={amount}")
+        self.write_bits((sz << (sz * 8)) | amount, 4 + sz * 8)
 
     def write_coins(self, amount: int) -> None:
         self.write_grams(amount)
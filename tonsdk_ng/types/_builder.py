@@ -1,6 +1,7 @@
 from ._address import Address
 from ._bit_string import BitString
 from ._cell import Cell
+from ._intern import intern_cell
 from ._slice import Slice
 
 
@@ -34,7 +35,8 @@ class Builder:
     def store_slice(self, src: Slice) -> "Builder":
         if len(self.refs) + len(src.refs) > 4:
             raise ValueError("refs overflow")
-        self.bits.write_bit_array(src.bits)
+        bits = src.bits
+        self.bits._write_bit_run(bits.tobytes(), len(bits))
         for i in range(src.ref_offset, len(src.refs)):
             self.store_ref(src.refs[i])
         return self
@@ -92,11 +94,16 @@ class Builder:
         return self
 
     def end_cell(self) -> Cell:
+        """Returns a frozen cell with the builder's current content.
+
+        The builder stays writable, later stores do not affect the cell.
+        With cell interning enabled the canonical instance is returned, see
+        enable_cell_interning."""
         cell = Cell()
-        cell.bits = self.bits
-        cell.refs = self.refs
+        cell.bits = self.bits.copy()
+        cell.refs = list(self.refs)
         cell.is_exotic = self.is_exotic
-        return cell
+        return intern_cell(cell.freeze())
 
 
 def begin_cell() -> Builder:
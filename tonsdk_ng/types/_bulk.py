@@ -0,0 +1,79 @@
+from __future__ import annotations
+
+from collections.abc import Iterable
+from concurrent.futures import Executor
+
+from tonsdk_ng.utils import map_chunks, topological_sort
+
+from ._bit_string import BitString
+from ._cell import Cell, CellInfo
+from ._intern import intern_cell
+
+# Cell tree flattened in BOC order, the root goes first. Every cell is
+# (data, bits length, is exotic, refs indexes, level mask, depths, hashes).
+PackedCell = tuple[
+    bytes, int, bool, tuple[int, ...], int, tuple[int, ...], tuple[bytes, ...]
+]
+
+
+def pack_cell(root: Cell) -> list[PackedCell]:
+    """Flattens the tree for cheap pickling, unlike pickling of cells it
+    is not recursive and keeps the computed hashes."""
+    computed: dict[int, CellInfo] = {}
+    order, index = topological_sort([root], computed)
+    packed = []
+    for _, cell in order:
+        info = cell.get_info(computed)
+        packed.append(
+            (
+                bytes(cell.bits.array[: (cell.bits.cursor + 7) // 8]),
+                cell.bits.cursor,
+                cell.is_exotic,
+                tuple(index[ref.get_info(computed).hash] for ref in cell.refs),
+                info.level_mask,
+                info.depths,
+                info.hashes,
+            )
+        )
+    return packed
+
+
+def unpack_cell(packed: list[PackedCell]) -> Cell:
+    """Restores a frozen tree flattened by pack_cell."""
+    cells: list[Cell] = [Cell() for _ in packed]
+    for i in range(len(packed) - 1, -1, -1):
+        data, bits_sz, is_exotic, refs, level_mask, depths, hashes = packed[i]
+        cell = cells[i]
+        cell.bits = BitString(0)
+        cell.bits.array = bytearray(data)
+        cell.bits.length = cell.bits.cursor = bits_sz
+        cell.is_exotic = is_exotic
+        cell.refs = [cells[ref] for ref in refs]
+        data = cell._data_with_descriptors(level_mask)
+        cell._info = CellInfo(
+            level_mask, depths[-1], hashes[-1], data, depths, hashes
+        )
+        # refs are frozen already, so only this cell is visited
+        cell.freeze()
+    return intern_cell(cells[0])
+
+
+def parse_chunk(serialized_bocs: list[str | bytes]) -> list[list[PackedCell]]:
+    return [pack_cell(Cell.one_from_boc(boc)) for boc in serialized_bocs]
+
+
+def parse_bocs(
+    serialized_bocs: Iterable[str | bytes],
+    workers: int | None = None,
+    executor: Executor | None = None,
+    chunk_size: int = 64,
+) -> list[Cell]:
+    """Parses single-root BOCs (bytes, hex or base64 strings) and returns
+    their frozen root cells in the input order. Runs through map_chunks."""
+    bocs = list(serialized_bocs)
+    if executor is None and (workers == 1 or len(bocs) <= chunk_size):
+        # parsed cells are used as is, without flattening
+        return [Cell.one_from_boc(boc) for boc in bocs]
+
+    packed = map_chunks(parse_chunk, bocs, workers, executor, chunk_size)
+    return [unpack_cell(cell) for cell in packed]
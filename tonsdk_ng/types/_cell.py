@@ -1,18 +1,70 @@
 from __future__ import annotations
 
-import copy
+import base64
 import io
 import math
 from hashlib import sha256
-from typing import NamedTuple, TYPE_CHECKING
+from collections.abc import Iterable
+from concurrent.futures import Executor
+from enum import IntEnum
+from typing import Any, BinaryIO, NamedTuple, TYPE_CHECKING
 
-from tonsdk_ng.utils import bytes_to_b64str, crc32c, tree_walk
+from tonsdk_ng.utils import bytes_to_b64str, crc32c, topological_sort
 from ._bit_string import BitString
 
 if TYPE_CHECKING:
     from ._slice import Slice
 
 
+class FrozenRefs(list["Cell"]):
+    """List of cell references which can not be modified."""
+
+    def _frozen(self, *args: Any, **kwargs: Any) -> Any:
+        raise Exception("Cell refs are frozen")
+
+    append = extend = insert = remove = pop = clear = _frozen
+    sort = reverse = __setitem__ = __delitem__ = _frozen
+    __iadd__ = __imul__ = _frozen
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        return FrozenRefs, (list(self),)
+
+
+class CellType(IntEnum):
+    """Cell types, exotic cells store their type in the first byte."""
+
+    ORDINARY = -1
+    PRUNED_BRANCH = 1
+    LIBRARY = 2
+    MERKLE_PROOF = 3
+    MERKLE_UPDATE = 4
+
+
+class CellInfo(NamedTuple):
+    level_mask: int
+    # representation depth and hash, i.e. at the highest level
+    depth: int
+    hash: bytes
+    # d1 d2 descriptors followed by the top-upped data bits, the part of
+    # the representation shared by hashing and BOC serialization
+    data: bytes
+    # depths and hashes of the significant levels in ascending order,
+    # the last ones are the representation depth and hash
+    depths: tuple[int, ...]
+    hashes: tuple[bytes, ...]
+
+    @property
+    def level(self) -> int:
+        return self.level_mask.bit_length()
+
+    def level_index(self, level: int) -> int:
+        """Index of the level's depth and hash in depths and hashes.
+
+        Levels which are not significant share them with the closest
+        significant level below."""
+        return (self.level_mask & ((1 << level) - 1)).bit_count()
+
+
 class Cell:
     REACH_BOC_MAGIC_PREFIX = bytes.fromhex("b5ee9c72")
     LEAN_BOC_MAGIC_PREFIX = bytes.fromhex("68ff65f3")
@@ -22,6 +74,7 @@ class Cell:
         self.bits = BitString(1023)
         self.refs: list[Cell] = []
         self.is_exotic = False
+        self._info: CellInfo | None = None
 
     def __repr__(self) -> str:
         return "<Cell refs_num: %d, %s>" % (len(self.refs), repr(self.bits))
@@ -29,12 +82,244 @@ class Cell:
     def __bool__(self) -> bool:
         return bool(self.bits.cursor) or bool(self.refs)
 
+    def freeze(self) -> Cell:
+        """Makes the cell and all its descendants read-only.
+
+        Frozen cells compute their hash, depth and level once and reuse
+        them afterwards. Any attempt to modify bits or refs of a frozen
+        cell raises an exception."""
+        stack = [self]
+        while stack:
+            cell = stack.pop()
+            if cell.is_frozen():
+                continue
+            cell.bits.freeze()
+            cell.refs = FrozenRefs(cell.refs)
+            stack.extend(cell.refs)
+        return self
+
+    def frozen_copy(self) -> Cell:
+        """Returns a frozen cell with the same content, the tree itself is
+        not modified. Frozen subtrees are shared, unfrozen cells are
+        copied."""
+        copies: dict[int, Cell] = {}
+        stack = [(self, False)]
+        while stack:
+            cell, refs_ready = stack.pop()
+            if id(cell) in copies:
+                continue
+            if cell.is_frozen():
+                copies[id(cell)] = cell
+                continue
+            if not refs_ready:
+                stack.append((cell, True))
+                stack.extend((ref, False) for ref in cell.refs)
+                continue
+
+            copy = Cell()
+            copy.is_exotic = cell.is_exotic
+            copy.bits = cell.bits.copy()
+            copy.bits.freeze()
+            copy.refs = FrozenRefs(copies[id(ref)] for ref in cell.refs)
+            copies[id(cell)] = copy
+        return copies[id(self)]
+
+    def is_frozen(self) -> bool:
+        return isinstance(self.refs, FrozenRefs)
+
+    def get_info(self, computed: dict[int, CellInfo] | None = None) -> CellInfo:
+        """Returns level, depth and representation hash of the cell.
+
+        Every distinct cell of the tree is visited once. Results are
+        cached on frozen cells only, results for unfrozen cells are put
+        into `computed` (keyed by id()) which may be shared between calls
+        on the same tree while it is not modified."""
+        if self._info is not None:
+            return self._info
+
+        if computed is None:
+            computed = {}
+
+        def lookup(cell: Cell) -> CellInfo | None:
+            if cell._info is not None:
+                return cell._info
+            return computed.get(id(cell))
+
+        info = lookup(self)
+        if info is not None:
+            return info
+
+        stack = [(self, False)]
+        while stack:
+            cell, children_ready = stack.pop()
+            if lookup(cell) is not None:
+                continue
+            if not children_ready:
+                stack.append((cell, True))
+                stack.extend((r, False) for r in cell.refs if lookup(r) is None)
+                continue
+
+            refs_info = [lookup(r) for r in cell.refs]
+            info = cell._compute_info(refs_info)  # type: ignore[arg-type]
+            if cell.is_frozen():
+                cell._info = info
+            else:
+                computed[id(cell)] = info
+
+        info = lookup(self)
+        assert info is not None
+        return info
+
+    def _compute_info(self, refs_info: list[CellInfo]) -> CellInfo:
+        if self.is_exotic:
+            return self._compute_exotic_info(refs_info)
+
+        level_mask = 0
+        for r in refs_info:
+            level_mask |= r.level_mask
+        if level_mask:
+            return self._compute_level_info(
+                CellType.ORDINARY, level_mask, refs_info
+            )
+
+        # level 0 cells have a single hash
+        depth = max((r.depth for r in refs_info), default=-1) + 1
+        data = self._data_with_descriptors(0)
+        repr_array = [data]
+        for r in refs_info:
+            repr_array.append(r.depth.to_bytes(2, "big"))
+        for r in refs_info:
+            repr_array.append(r.hash)
+        cell_hash = sha256(b"".join(repr_array)).digest()
+        return CellInfo(0, depth, cell_hash, data, (depth,), (cell_hash,))
+
+    def _compute_exotic_info(self, refs_info: list[CellInfo]) -> CellInfo:
+        """Checks the layout of the exotic cell and computes its info."""
+        cell_type = self.get_type()
+        bits = self.bits.cursor
+        data = self.bits.array
+        match cell_type:
+            case CellType.PRUNED_BRANCH:
+                # type: uint8 level_mask:uint8 hashes depths, one for
+                # every significant level below the cell level
+                level_mask = data[1] if bits >= 16 else 0
+                if not 1 <= level_mask.bit_length() <= 3:
+                    raise ValueError("Invalid pruned branch level mask")
+                if bits != 8 * (2 + 34 * level_mask.bit_count()):
+                    raise ValueError("Invalid pruned branch size")
+                if refs_info:
+                    raise ValueError("Pruned branch can not have refs")
+            case CellType.LIBRARY:
+                # type: uint8 hash:bits256
+                if bits != 8 + 256 or refs_info:
+                    raise ValueError("Invalid library cell")
+                level_mask = 0
+            case CellType.MERKLE_PROOF | CellType.MERKLE_UPDATE:
+                # type: uint8 hashes:bits256 depths:uint16, one for every
+                # ref: the proved (or old and new) tree
+                refs_num = 1 if cell_type == CellType.MERKLE_PROOF else 2
+                if bits != 8 + 272 * refs_num or len(refs_info) != refs_num:
+                    raise ValueError(f"Invalid {cell_type.name} cell")
+                level_mask = 0
+                for i, r in enumerate(refs_info):
+                    pos = 1 + 32 * refs_num + 2 * i
+                    if (
+                        data[1 + 32 * i : 33 + 32 * i] != r.hashes[0]
+                        or int.from_bytes(data[pos : pos + 2], "big")
+                        != r.depths[0]
+                    ):
+                        raise ValueError(
+                            f"{cell_type.name} hash does not match its ref"
+                        )
+                    level_mask |= r.level_mask
+                level_mask >>= 1
+
+        return self._compute_level_info(cell_type, level_mask, refs_info)
+
+    def _compute_level_info(
+        self, cell_type: CellType, level_mask: int, refs_info: list[CellInfo]
+    ) -> CellInfo:
+        """Computes depths and hashes of every significant level."""
+        depths: list[int] = []
+        hashes: list[bytes] = []
+        # level 0 and levels of the mask bits
+        levels = [0] + [i + 1 for i in range(3) if level_mask >> i & 1]
+        if cell_type == CellType.PRUNED_BRANCH:
+            # only the highest level is computed, the others are stored
+            count = len(levels) - 1
+            array = self.bits.array
+            hashes = [
+                bytes(array[2 + 32 * i : 34 + 32 * i]) for i in range(count)
+            ]
+            pos = 2 + 32 * count
+            depths = [
+                int.from_bytes(array[pos + 2 * i : pos + 2 * i + 2], "big")
+                for i in range(count)
+            ]
+            levels = levels[-1:]
+        # Merkle cells hide one level of their refs
+        shift = cell_type in (CellType.MERKLE_PROOF, CellType.MERKLE_UPDATE)
+
+        data = self._data_with_descriptors(level_mask)
+        previous = data[2:]
+        for level in levels:
+            # descriptors of a level count only the mask bits below it,
+            # higher levels hash the hash of the previous one instead of
+            # the data bits
+            d1 = data[0] & 0b11111 | (level_mask & ((1 << level) - 1)) << 5
+            repr_array = [bytes((d1,)), data[1:2], previous]
+
+            refs_index = [r.level_index(level + shift) for r in refs_info]
+            depth = -1
+            for r, i in zip(refs_info, refs_index, strict=True):
+                depth = max(depth, r.depths[i])
+                repr_array.append(r.depths[i].to_bytes(2, "big"))
+            for r, i in zip(refs_info, refs_index, strict=True):
+                repr_array.append(r.hashes[i])
+            previous = sha256(b"".join(repr_array)).digest()
+            depths.append(depth + 1)
+            hashes.append(previous)
+
+        return CellInfo(
+            level_mask,
+            depths[-1],
+            hashes[-1],
+            data,
+            tuple(depths),
+            tuple(hashes),
+        )
+
+    def get_type(self) -> CellType:
+        if not self.is_exotic:
+            return CellType.ORDINARY
+        if self.bits.cursor < 8:
+            raise ValueError("Not enough data for an exotic cell")
+        try:
+            return CellType(self.bits.array[0])
+        except ValueError:
+            raise ValueError(
+                f"Unknown exotic cell type {self.bits.array[0]}"
+            ) from None
+
+    def get_level_mask(self) -> int:
+        return self.get_info().level_mask
+
+    def get_hash(self, level: int = 3) -> bytes:
+        """Returns the hash of the cell at the level, the representation
+        hash by default."""
+        info = self.get_info()
+        return info.hashes[info.level_index(level)]
+
+    def get_depth(self, level: int = 3) -> int:
+        info = self.get_info()
+        return info.depths[info.level_index(level)]
+
     def bytes_hash(self) -> bytes:
-        return sha256(self.bytes_repr()).digest()
+        return self.get_info().hash
 
     def bytes_repr(self) -> bytes:
         repr_array = list()
-        repr_array.append(self.get_data_with_descriptors())
+        repr_array.append(self.get_info().data)
         for ref in self.refs:
             repr_array.append(ref.get_max_depth_as_array())
         for ref in self.refs:
@@ -46,74 +331,60 @@ class Cell:
         self.refs += another_cell.refs
 
     def get_data_with_descriptors(self) -> bytes:
-        d1 = self.get_refs_descriptor()
-        d2 = self.get_bits_descriptor()
+        return self.get_info().data
+
+    def _data_with_descriptors(self, level_mask: int) -> bytes:
+        d1 = len(self.refs) + self.is_exotic * 8 + level_mask * 32
+        d2 = (self.bits.cursor + 7) // 8 + self.bits.cursor // 8
         tuBits = self.bits.get_top_upped_array()
-        return d1 + d2 + tuBits
+        tuBits[0:0] = (d1, d2)
+        return bytes(tuBits)
 
     def get_bits_descriptor(self) -> bytearray:
         d2 = bytearray([0])
-        d2[0] = math.ceil(self.bits.cursor / 8) + math.floor(
-            self.bits.cursor / 8
-        )
+        d2[0] = (self.bits.cursor + 7) // 8 + self.bits.cursor // 8
         return d2
 
     def get_refs_descriptor(self) -> bytearray:
+        return self._refs_descriptor(self.get_level_mask())
+
+    def _refs_descriptor(self, level_mask: int) -> bytearray:
         d1 = bytearray([0])
-        d1[0] = len(self.refs) + self.is_exotic * 8 + self.get_max_level() * 32
+        d1[0] = len(self.refs) + self.is_exotic * 8 + level_mask * 32
         return d1
 
     def get_max_level(self) -> int:
-        if self.is_exotic:
-            raise NotImplementedError(
-                "Calculating max level for exotic cells is not implemented"
-            )
-        max_level = 0
-        for r in self.refs:
-            r_max_level = r.get_max_level()
-            if r_max_level > max_level:
-                max_level = r_max_level
-        return max_level
+        return self.get_info().level
 
     def get_max_depth_as_array(self) -> bytearray:
         max_depth = self.get_max_depth()
         return bytearray([max_depth // 256, max_depth % 256])
 
     def get_max_depth(self) -> int:
-        max_depth = 0
-        if len(self.refs) > 0:
-            for r in self.refs:
-                r_max_depth = r.get_max_depth()
-                if r_max_depth > max_depth:
-                    max_depth = r_max_depth
-            max_depth += 1
-        return max_depth
+        return self.get_info().depth
 
     def tree_walk(self) -> tuple[list[tuple[bytes, "Cell"]], dict[bytes, int]]:
-        return tree_walk(self, [], {})
+        return topological_sort([self])
 
     def is_explicitly_stored_hashes(self) -> int:
         return 0
 
     def serialize_for_boc(
-        self, cells_index: dict[bytes, int], ref_size: int
+        self,
+        cells_index: dict[bytes, int],
+        ref_size: int,
+        computed: dict[int, CellInfo] | None = None,
     ) -> bytes:
-        repr_arr = []
-
-        repr_arr.append(self.get_data_with_descriptors())
+        repr_arr = [self.get_info(computed).data]
         if self.is_explicitly_stored_hashes():
             raise NotImplementedError(
                 "Cell hashes explicit storing is not implemented"
             )
 
         for ref in self.refs:
-            ref_hash = ref.bytes_hash()
-            ref_index_int = cells_index[ref_hash]
-            ref_index_hex = format(ref_index_int, "x")
-            if len(ref_index_hex) % 2:
-                ref_index_hex = "0" + ref_index_hex
-            reference = bytes.fromhex(ref_index_hex)
-            repr_arr.append(reference)
+            ref_hash = ref.get_info(computed).hash
+            ref_index = cells_index[ref_hash]
+            repr_arr.append(ref_index.to_bytes(ref_size, "big"))
 
         return b"".join(repr_arr)
 
@@ -129,63 +400,24 @@ class Cell:
         has_cache_bits: bool = False,
         flags: int = 0,
     ) -> bytes:
-        root_cell = copy.deepcopy(self)
-
-        all_cells = root_cell.tree_walk()
-        topological_order = all_cells[0]
-        cells_index = all_cells[1]
-
-        cells_num = len(topological_order)
-        # Minimal number of bits to represent reference (unused?)
-        s = len(f"{cells_num:b}")
-        s_bytes = max(math.ceil(s / 8), 1)
-        full_size = 0
-        cell_sizes = {}
-        for _hash, subcell in topological_order:
-            cell_sizes[_hash] = subcell.boc_serialization_size(
-                cells_index, s_bytes
-            )
-            full_size += cell_sizes[_hash]
+        return to_boc_multi_root(
+            [self], has_idx, hash_crc32, has_cache_bits, flags
+        )
 
-        offset_bits = len(f"{full_size:b}")
-        offset_bytes = max(math.ceil(offset_bits / 8), 1)
+    def write_boc(
+        self,
+        stream: BinaryIO,
+        has_idx: bool = True,
+        hash_crc32: bool = True,
+        has_cache_bits: bool = False,
+        flags: int = 0,
+    ) -> int:
+        """Writes the BOC to a writable binary file-like object.
 
-        serialization = BitString(
-            (1023 + 32 * 4 + 32 * 3) * len(topological_order)
+        Returns the number of written bytes."""
+        return write_boc_multi_root(
+            stream, [self], has_idx, hash_crc32, has_cache_bits, flags
         )
-        serialization.write_bytes(Cell.REACH_BOC_MAGIC_PREFIX)
-        settings = bytes(
-            "".join(
-                [
-                    "1" if i else "0"
-                    for i in [has_idx, hash_crc32, has_cache_bits]
-                ]
-            ),
-            "utf-8",
-        )
-        serialization.write_bit_array(settings)
-        serialization.write_uint(flags, 2)
-        serialization.write_uint(s_bytes, 3)
-        serialization.write_uint8(offset_bytes)
-        serialization.write_uint(cells_num, s_bytes * 8)
-        serialization.write_uint(1, s_bytes * 8)  # One root for now
-        serialization.write_uint(0, s_bytes * 8)  # Complete BOCs only
-        serialization.write_uint(full_size, offset_bytes * 8)
-        serialization.write_uint(0, s_bytes * 8)  # Root shoulh have index 0
-
-        if has_idx:
-            for _hash, subcell in topological_order:
-                serialization.write_uint(cell_sizes[_hash], offset_bytes * 8)
-
-        for cell_info in topological_order:
-            ref_cell_ser = cell_info[1].serialize_for_boc(cells_index, s_bytes)
-            serialization.write_bytes(ref_cell_ser)
-
-        ser_arr = serialization.get_top_upped_array()
-        if hash_crc32:
-            ser_arr += crc32c(ser_arr)
-
-        return ser_arr
 
     def to_boc_b64str(
         self,
@@ -209,8 +441,21 @@ class Cell:
         return Slice(self)
 
     @staticmethod
-    def one_from_boc(serialized_boc: str | bytes) -> "Cell":
-        cells = from_boc_multi_root(serialized_boc)
+    def many_from_boc(
+        serialized_bocs: Iterable[str | bytes],
+        workers: int | None = None,
+        executor: Executor | None = None,
+        chunk_size: int = 64,
+    ) -> list[Cell]:
+        """Parses single-root BOCs in worker processes, see
+        tonsdk_ng.types.parse_bocs."""
+        from ._bulk import parse_bocs
+
+        return parse_bocs(serialized_bocs, workers, executor, chunk_size)
+
+    @staticmethod
+    def one_from_boc(serialized_boc: str | bytes, lazy: bool = False) -> Cell:
+        cells = from_boc_multi_root(serialized_boc, lazy)
 
         if len(cells) != 1:
             raise ValueError("Expected 1 root cell")
@@ -218,6 +463,135 @@ class Cell:
         return cells[0]
 
 
+def to_boc_multi_root(
+    roots: list[Cell],
+    has_idx: bool = True,
+    hash_crc32: bool = True,
+    has_cache_bits: bool = False,
+    flags: int = 0,
+) -> bytes:
+    """Serializes several trees into one BOC.
+
+    Cells shared between the trees are stored once. Roots keep their
+    order, see from_boc_multi_root."""
+    header, cells_data = boc_layout(
+        roots, has_idx, hash_crc32, has_cache_bits, flags
+    )
+    boc = bytearray(len(header) + sum(map(len, cells_data)) + 4 * hash_crc32)
+    view = memoryview(boc)
+    view[: len(header)] = header
+    offset = len(header)
+    for cell_data in cells_data:
+        view[offset : offset + len(cell_data)] = cell_data
+        offset += len(cell_data)
+    if hash_crc32:
+        view[offset:] = crc32c(view[:offset])
+
+    return boc
+
+
+def write_boc_multi_root(
+    stream: BinaryIO,
+    roots: list[Cell],
+    has_idx: bool = True,
+    hash_crc32: bool = True,
+    has_cache_bits: bool = False,
+    flags: int = 0,
+) -> int:
+    """Writes several trees as one BOC to a writable binary file-like
+    object. Returns the number of written bytes."""
+    header, cells_data = boc_layout(
+        roots, has_idx, hash_crc32, has_cache_bits, flags
+    )
+    stream.write(header)
+    size = len(header)
+    if hash_crc32:
+        crc = crc32c(header)
+    for cell_data in cells_data:
+        stream.write(cell_data)
+        if hash_crc32:
+            crc = crc32c(cell_data, crc)
+        size += len(cell_data)
+    if hash_crc32:
+        stream.write(crc)
+        size += len(crc)
+    return size
+
+
+def boc_layout(
+    roots: list[Cell],
+    has_idx: bool = True,
+    hash_crc32: bool = True,
+    has_cache_bits: bool = False,
+    flags: int = 0,
+) -> tuple[bytearray, list[bytes]]:
+    """Serializes cells of the trees for a BOC.
+
+    Returns the BOC header (including roots list and offsets index)
+    packed into a single buffer and the serialized cells in their BOC
+    order. The CRC32C checksum is not included."""
+    if not roots:
+        raise ValueError("BOC should have at least one root")
+    if has_cache_bits and not has_idx:
+        raise ValueError("Cache flag cannot be set without index flag")
+    if not 0 <= flags <= 0b11:
+        raise ValueError(f"Invalid BOC flags {flags}")
+
+    # the tree is only read, hashes of unfrozen cells are kept aside
+    computed: dict[int, CellInfo] = {}
+    topological_order, cells_index = topological_sort(roots, computed)
+
+    cells_num = len(topological_order)
+    # Minimal number of bytes to represent reference
+    s_bytes = max(math.ceil(cells_num.bit_length() / 8), 1)
+    cells_data = [
+        subcell.serialize_for_boc(cells_index, s_bytes, computed)
+        for _, subcell in topological_order
+    ]
+    full_size = sum(map(len, cells_data))
+    offset_bytes = max(
+        math.ceil((full_size << has_cache_bits).bit_length() / 8), 1
+    )
+
+    header = bytearray(
+        4
+        + 2
+        + s_bytes * (3 + len(roots))
+        + offset_bytes * (1 + cells_num * has_idx)
+    )
+    header[:4] = Cell.REACH_BOC_MAGIC_PREFIX
+    header[4] = (
+        has_idx << 7 | hash_crc32 << 6 | has_cache_bits << 5 | flags << 3
+    ) | s_bytes
+    header[5] = offset_bytes
+    pos = 6
+    for value, size in (
+        (cells_num, s_bytes),
+        (len(roots), s_bytes),
+        (0, s_bytes),  # Complete BOCs only
+        (full_size, offset_bytes),
+    ):
+        header[pos : pos + size] = value.to_bytes(size, "big")
+        pos += size
+
+    for root in roots:
+        root_index = cells_index[root.get_info(computed).hash]
+        header[pos : pos + s_bytes] = root_index.to_bytes(s_bytes, "big")
+        pos += s_bytes
+
+    if has_idx:
+        # every entry is the end offset of the cell
+        cell_end = 0
+        for cell_data in cells_data:
+            cell_end += len(cell_data)
+            header[pos : pos + offset_bytes] = (
+                cell_end << has_cache_bits
+            ).to_bytes(offset_bytes, "big")
+            pos += offset_bytes
+
+    return header, cells_data
+
+
 class Flags(NamedTuple):
     has_index: bool
     has_crc32c: bool
@@ -233,9 +607,25 @@ class Flags(NamedTuple):
         )
 
 
-def from_boc_multi_root(data: bytes | bytearray | str) -> list[Cell]:
+def from_boc_multi_root(
+    data: bytes | bytearray | str, lazy: bool = False
+) -> list[Cell]:
+    """Parses a BOC and returns its root cells.
+
+    A string is read as hex, or as base64 (standard or URL-safe) if it
+    is not a valid hex.
+
+    With `lazy` the cells are decoded on first access straight from the
+    BOC data, which should not be modified afterwards. Untouched
+    subtrees are never decoded, and corrupted cells are detected only
+    when accessed. Lazy cells are never interned (see
+    enable_cell_interning)."""
     if isinstance(data, str):
-        data = bytes.fromhex(data)
+        try:
+            data = bytes.fromhex(data)
+        except ValueError:
+            # BOC magic prefixes are never valid hex in base64
+            data = base64.b64decode(data, altchars=b"-_")
 
     if len(data) < 10:
         raise ValueError("invalid boc")
@@ -279,6 +669,32 @@ def from_boc_multi_root(data: bytes | bytearray | str) -> list[Cell]:
     if flags.has_cache_bits and not flags.has_index:
         raise ValueError("Cache flag cannot be set without index flag")
 
+    if cells_num > data_len // 2:
+        raise ValueError(
+            f"Cells num looks malicious: data len {data_len}, cells {cells_num}"
+        )
+
+    if lazy:
+        from ._lazy_cell import LazyBoc
+
+        index_start = r.tell()
+        payload_start = index_start + flags.has_index * (
+            cells_num * data_size_bytes
+        )
+        if len(data) < payload_start + data_len:
+            raise ValueError("invalid boc")
+
+        view = memoryview(data)
+        boc = LazyBoc(
+            view[payload_start : payload_start + data_len],
+            cells_num,
+            cell_num_size_bytes,
+            view[index_start:payload_start] if flags.has_index else None,
+            data_size_bytes,
+            flags.has_cache_bits,
+        )
+        return [boc.cell(idx) for idx in roots_index]
+
     index: list[int] = []
     if flags.has_index:
         idx_data = r.read(cells_num * data_size_bytes)
@@ -291,17 +707,93 @@ def from_boc_multi_root(data: bytes | bytearray | str) -> list[Cell]:
                 val //= 2
             index.append(val)
 
-    if cells_num > data_len // 2:
-        raise ValueError(
-            f"Cells num looks malicious: data len {data_len}, cells {cells_num}"
-        )
-
     payload = r.read(data_len)
     cells = parse_cells(
         roots_index, cells_num, cell_num_size_bytes, payload, index
     )
 
-    return cells
+    from ._intern import intern_cell
+
+    return [intern_cell(cell) for cell in cells]
+
+
+class RawCell(NamedTuple):
+    is_exotic: bool
+    bits_sz: int
+    # cell data, the last byte may contain the completion tag
+    data: bytes | memoryview
+    refs: list[int]
+    # offset of the next cell
+    end: int
+
+
+def read_raw_cell(
+    data: bytes | memoryview, offset: int, ref_sz_bytes: int
+) -> RawCell:
+    """Reads a serialized cell from the BOC cells data at the offset."""
+    hash_size = 32
+    depth_size = 2
+
+    if len(data) - offset < 2:
+        raise ValueError("Failed to parse cell header, corrupted data")
+
+    flags = data[offset]
+    refs_num = flags & 0b111
+    is_exotic = bool(flags & 0b1000)
+    with_hashes = bool(flags & 0b10000)
+    level_mask = flags >> 5
+
+    if refs_num > 4:
+        raise ValueError("Too many refs in cell")
+
+    ln = data[offset + 1]
+    one_more = ln % 2
+    sz = ln // 2 + one_more
+
+    offset += 2
+    if with_hashes:
+        # hashes and depths of every significant level go before the data,
+        # they are computed again rather than trusted
+        hashes_num = level_mask.bit_count() + 1
+        offset += hashes_num * hash_size + hashes_num * depth_size
+
+    if len(data) - offset < sz:
+        raise ValueError("Failed to parse cell payload, corrupted data")
+
+    payload = data[offset : offset + sz]
+
+    offset += sz
+    if len(data) - offset < refs_num * ref_sz_bytes:
+        raise ValueError("Failed to parse cell refs, corrupted data")
+
+    refs_index = [
+        big_int(data[ref_off : ref_off + ref_sz_bytes])
+        for ref_off in range(
+            offset, offset + refs_num * ref_sz_bytes, ref_sz_bytes
+        )
+    ]
+    offset += refs_num * ref_sz_bytes
+
+    bits_sz = ln * 4
+
+    # if not full byte
+    if ln % 2 != 0:
+        # find last bit of byte which indicates the end and cut it and next
+        for y in range(8):
+            if (payload[-1] >> y) & 1 == 1:
+                bits_sz += 3 - y
+                break
+
+    return RawCell(is_exotic, bits_sz, payload, refs_index, offset)
+
+
+def check_ref_index(i: int, ref: int, cells_num: int, has_index: bool) -> None:
+    if i == ref:
+        raise ValueError("Recursive reference of cells")
+    if ref < i and not has_index:
+        raise ValueError("Reference to index which is behind parent cell")
+    if ref >= cells_num:
+        raise ValueError("Invalid index, out of scope")
 
 
 def parse_cells(
@@ -312,82 +804,29 @@ def parse_cells(
     index: list[int],
 ) -> list[Cell]:
     cells = [Cell() for _ in range(cells_num)]
-    hash_size = 32
-    depth_size = 2
     offset = 0
 
     for i in range(cells_num):
-        if len(data) - offset < 2:
-            raise ValueError("Failed to parse cell header, corrupted data")
-
         if index:
             # if we have index, then set offset from it,
             # it stores end of each cell
             offset = index[i - 1] if i > 0 else 0
 
-        flags = data[offset]
-        refs_num = flags & 0b111
-        is_exotic = bool(flags & 0b1000)
-        with_hashes = bool(flags & 0b10000)
-        level_mask = flags >> 5
-
-        if refs_num > 4:
-            raise ValueError("Too many refs in cell")
-
-        ln = data[offset + 1]
-        one_more = ln % 2
-        sz = ln // 2 + one_more
-
-        offset += 2
-        if len(data) - offset < sz:
-            raise ValueError("Failed to parse cell payload, corrupted data")
-
-        if with_hashes:
-            mask_bits = int(math.ceil(math.log2(level_mask + 1)))
-            hashes_num = mask_bits + 1
-            offset += hashes_num * hash_size + hashes_num * depth_size
-
-        payload = data[offset : offset + sz]
-
-        offset += sz
-        if len(data) - offset < refs_num * ref_sz_bytes:
-            raise ValueError("Failed to parse cell refs, corrupted data")
-
-        refs_index = [
-            big_int(data[offset : offset + ref_sz_bytes])
-            for _ in range(refs_num)
-        ]
-        offset += refs_num * ref_sz_bytes
+        raw = read_raw_cell(data, offset, ref_sz_bytes)
+        offset = raw.end
 
         refs = []
-        for y, id in enumerate(refs_index):
-            if i == id:
-                raise ValueError("Recursive reference of cells")
-            if id < i and not index:
-                raise ValueError(
-                    "Reference to index which is behind parent cell"
-                )
-            if id >= len(cells):
-                raise ValueError("Invalid index, out of scope")
-
-            refs.append(cells[id])
-
-        bits_sz = ln * 4
-
-        # if not full byte
-        if ln % 2 != 0:
-            # find last bit of byte which indicates the end and cut it and next
-            for y in range(8):
-                if (payload[-1] >> y) & 1 == 1:
-                    bits_sz += 3 - y
-                    break
-
-        cells[i].is_exotic = is_exotic
-        cells[i].bits.write_bytes(payload)
-        cells[i].bits.length = bits_sz
+        for ref in raw.refs:
+            check_ref_index(i, ref, cells_num, bool(index))
+            refs.append(cells[ref])
+
+        cells[i].is_exotic = raw.is_exotic
+        cells[i].bits.write_bytes(raw.data)
+        cells[i].bits.length = raw.bits_sz
+        cells[i].bits.cursor = raw.bits_sz
         cells[i].refs = refs
 
-    roots = [cells[idx] for idx in roots_index]
+    roots = [cells[idx].freeze() for idx in roots_index]
     return roots
 
 
@@ -1,7 +1,12 @@
 from .find_common_prefix import find_common_prefix
+from .parse_dict import DictReader, parse_dict
+from .persistent_dict import PersistentDict
 from .serialize_dict import serialize_dict
 
 __all__ = [
+    "DictReader",
+    "parse_dict",
+    "PersistentDict",
     "serialize_dict",
     "find_common_prefix",
 ]
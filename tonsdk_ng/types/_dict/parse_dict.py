@@ -0,0 +1,173 @@
+from collections.abc import Callable, Iterator
+from typing import Generic, TypeVar
+
+from .._cell import Cell
+from .._slice import Slice
+
+T = TypeVar("T")
+Deserializer = Callable[[Slice], T]
+
+
+def read_label(s: Slice, key_size: int) -> tuple[int, int]:
+    """Reads an edge label of a node with key_size bits left.
+
+    Returns the label bits as an integer and their count."""
+    if not s.read_bit():
+        # hml_short$0 len:(Unary ~n) s:(n * Bit)
+        length = 0
+        while s.read_bit():
+            length += 1
+        if length > key_size:
+            raise ValueError("Invalid dictionary label")
+        return s.read_uint(length), length
+
+    len_bits = key_size.bit_length()  # ceil(log2(key_size + 1))
+    if not s.read_bit():
+        # hml_long$10 n:(#<= m) s:(n * Bit)
+        length = s.read_uint(len_bits)
+        if length > key_size:
+            raise ValueError("Invalid dictionary label")
+        return s.read_uint(length), length
+
+    # hml_same$11 v:Bit n:(#<= m)
+    bit = s.read_bit()
+    length = s.read_uint(len_bits)
+    if length > key_size:
+        raise ValueError("Invalid dictionary label")
+    return ((1 << length) - 1) * bit, length
+
+
+class DictReader(Generic[T]):
+    """Reads a Hashmap with key_size-bit unsigned keys without parsing it
+    as a whole.
+
+    root is the root cell as returned by serialize_dict and
+    Slice.load_dict, None for an empty dictionary. Values are read from
+    leaf slices by the deserializer, by default the rest of the leaf is
+    returned as a cell. Cells are only visited along the looked up paths,
+    iteration is lazy and goes in ascending key order."""
+
+    def __init__(
+        self,
+        root: Cell | None,
+        key_size: int,
+        deserializer: Deserializer[T] = Slice.read_rest,  # type: ignore
+    ):
+        self.root = root
+        self.key_size = key_size
+        self.deserializer = deserializer
+
+    @classmethod
+    def from_slice(
+        cls,
+        s: Slice,
+        key_size: int,
+        deserializer: Deserializer[T] = Slice.read_rest,  # type: ignore
+    ) -> "DictReader[T]":
+        """Reads a HashmapE (a maybe reference to the root) from the
+        slice."""
+        return cls(s.load_dict(), key_size, deserializer)
+
+    def _key(self, key: int | bytes) -> int:
+        if isinstance(key, bytes):
+            if len(key) * 8 != self.key_size:
+                raise ValueError(f"Key should be {self.key_size} bits long")
+            key = int.from_bytes(key, "big")
+        if not 0 <= key < 1 << self.key_size:
+            raise ValueError(f"Key does not fit {self.key_size} bits")
+        return key
+
+    def get(self, key: int | bytes, default: T | None = None) -> T | None:
+        """Looks the key up following a single path from the root."""
+        key = self._key(key)
+        cell, key_size = self.root, self.key_size
+        while cell is not None:
+            s = cell.begin_parse()
+            label, length = read_label(s, key_size)
+            key_size -= length
+            if key >> key_size != label:
+                break
+            key &= (1 << key_size) - 1
+            if key_size == 0:
+                return self.deserializer(s)
+
+            key_size -= 1
+            cell = s.refs[key >> key_size]
+            key &= (1 << key_size) - 1
+        return default
+
+    def __getitem__(self, key: int | bytes) -> T:
+        missing = object()
+        value = self.get(key, missing)  # type: ignore[arg-type]
+        if value is missing:
+            raise KeyError(key)
+        return value  # type: ignore[return-value]
+
+    def __contains__(self, key: int | bytes) -> bool:
+        missing = object()
+        return self.get(key, missing) is not missing  # type: ignore
+
+    def __iter__(self) -> Iterator[int]:
+        return (key for key, _ in self.items())
+
+    def keys(self) -> Iterator[int]:
+        return iter(self)
+
+    def values(self) -> Iterator[T]:
+        return (value for _, value in self.items())
+
+    def items(
+        self, start: int | bytes | None = None, stop: int | bytes | None = None
+    ) -> Iterator[tuple[int, T]]:
+        """Lazily yields (key, value) pairs with start <= key < stop in
+        ascending order. Subtrees out of the range are not visited."""
+        lo = 0 if start is None else self._key(start)
+        hi = 1 << self.key_size
+        if stop is not None and stop != hi:
+            hi = self._key(stop)
+        if self.root is None or lo >= hi:
+            return
+
+        # edges to visit: cell, key prefix before the edge, key bits left
+        stack = [(self.root, 0, self.key_size)]
+        while stack:
+            cell, prefix, key_size = stack.pop()
+            s = cell.begin_parse()
+            label, length = read_label(s, key_size)
+            key_size -= length
+            prefix = (prefix << length) | label
+            if (prefix + 1) << key_size <= lo or prefix << key_size >= hi:
+                continue
+            if key_size == 0:
+                yield prefix, self.deserializer(s)
+                continue
+
+            key_size -= 1
+            stack.append((s.refs[1], prefix << 1 | 1, key_size))
+            stack.append((s.refs[0], prefix << 1, key_size))
+
+    def prefix_items(
+        self, prefix: int, prefix_size: int
+    ) -> Iterator[tuple[int, T]]:
+        """Lazily yields items whose keys start with the prefix_size-bit
+        prefix, in ascending order."""
+        if not 0 <= prefix_size <= self.key_size:
+            raise ValueError(f"Prefix should fit {self.key_size} bits")
+        shift = self.key_size - prefix_size
+        return self.items(prefix << shift, (prefix + 1) << shift)
+
+
+def parse_dict(
+    root: Cell | None,
+    key_size: int,
+    deserializer: Deserializer[T] = Slice.read_rest,  # type: ignore
+) -> dict[int, T]:
+    """Parses the whole dictionary, the inverse of serialize_dict."""
+    return dict(DictReader(root, key_size, deserializer).items())
+
+
+__all__ = [
+    "DictReader",
+    "parse_dict",
+    "read_label",
+]
@@ -0,0 +1,175 @@
+from collections.abc import Iterable, Mapping
+
+from .._cell import Cell
+from .._slice import Slice
+from .parse_dict import DictReader, read_label
+from .serialize_dict import serialize_dict, write_label
+
+# forks passed on the way to a leaf: label, label length, key bits left
+# before the label, fork refs and the taken branch
+Path = list[tuple[int, int, int, list[Cell], int]]
+Items = Mapping[int, Cell] | Iterable[tuple[int, Cell]]
+
+
+def _edge(label: int, length: int, key_size: int, rest: Slice | Cell) -> Cell:
+    """Creates a frozen edge cell with the label followed by the bits and
+    refs of rest, either a leaf value or what is left of a parsed edge."""
+    cell = Cell()
+    write_label(label, length, key_size, cell.bits)
+    if isinstance(rest, Cell):
+        cell.write_cell(rest)
+    else:
+        cell.bits._write_bit_run(rest.bits.tobytes(), len(rest))
+        cell.refs = rest.refs[rest.ref_offset :]
+    return cell.freeze()
+
+
+def _fork(label: int, length: int, key_size: int, refs: list[Cell]) -> Cell:
+    cell = Cell()
+    write_label(label, length, key_size, cell.bits)
+    cell.refs = refs
+    return cell.freeze()
+
+
+class PersistentDict(DictReader[Cell]):
+    """Immutable Hashmap with key_size-bit unsigned keys over a dictionary
+    cell.
+
+    set, delete and merge return new dictionaries and copy only the cells
+    on the path from the root to the changed leaves, all other cells and
+    their cached hashes are shared with the original. Values are cells
+    whose bits and refs are stored in the leaves, the same way as
+    DictBuilder.store_cell does. The cells of the tree are frozen."""
+
+    def __init__(self, root: Cell | None, key_size: int):
+        super().__init__(root.freeze() if root is not None else None, key_size)
+
+    @classmethod
+    def from_slice(  # type: ignore[override]
+        cls, s: Slice, key_size: int
+    ) -> "PersistentDict":
+        """Reads a HashmapE (a maybe reference to the root) from the
+        slice."""
+        return cls(s.load_dict(), key_size)
+
+    @classmethod
+    def from_items(
+        cls, items: Mapping[int, Cell], key_size: int
+    ) -> "PersistentDict":
+        """Builds a dictionary from scratch."""
+        if not items:
+            return cls(None, key_size)
+
+        def serializer(src: Cell, dest: Cell) -> None:
+            dest.write_cell(src)
+
+        return cls(serialize_dict(dict(items), key_size, serializer), key_size)
+
+    def _rebuild(self, path: Path, cell: Cell | None) -> "PersistentDict":
+        for label, length, key_size, refs, bit in reversed(path):
+            refs = list(refs)
+            refs[bit] = cell  # type: ignore[call-overload]
+            cell = _fork(label, length, key_size, refs)
+        return type(self)(cell, self.key_size)
+
+    def _find(self, key: int) -> tuple[Path, Slice | None, int, int, int]:
+        """Follows the key from the root.
+
+        Returns the forks passed and the last visited edge: its slice
+        after the label, the label, its length and the key bits left
+        before it. The key matches a leaf if the label covers all the
+        bits left and the edge is the leaf."""
+        path: Path = []
+        cell, key_size = self.root, self.key_size
+        while cell is not None:
+            s = cell.begin_parse()
+            label, length = read_label(s, key_size)
+            rest = key_size - length
+            if key >> rest != label or rest == 0:
+                return path, s, label, length, key_size
+
+            key &= (1 << rest) - 1
+            rest -= 1
+            bit = key >> rest
+            key &= (1 << rest) - 1
+            path.append((label, length, key_size, s.refs, bit))
+            cell, key_size = s.refs[bit], rest
+        return path, None, 0, 0, key_size
+
+    def set(self, key: int | bytes, value: Cell) -> "PersistentDict":
+        """Returns a dictionary with the key set to the value."""
+        key = self._key(key)
+        path, s, label, length, key_size = self._find(key)
+        # bits of the key left before the edge
+        key &= (1 << key_size) - 1
+        if s is None:
+            cell = _edge(key, key_size, key_size, value)
+        elif key >> (key_size - length) == label:
+            cell = _edge(label, length, key_size, value)
+        else:
+            # split the edge where the key diverges from the label
+            diverge = (key >> (key_size - length) ^ label).bit_length()
+            prefix_size = length - diverge
+            child_size = key_size - prefix_size - 1
+            old = _edge(
+                label & ((1 << (diverge - 1)) - 1),
+                diverge - 1,
+                child_size,
+                s,
+            )
+            new = _edge(
+                key & ((1 << child_size) - 1), child_size, child_size, value
+            )
+            cell = _fork(
+                label >> diverge,
+                prefix_size,
+                key_size,
+                [new, old] if key >> child_size & 1 == 0 else [old, new],
+            )
+        return self._rebuild(path, cell)
+
+    def delete(self, key: int | bytes) -> "PersistentDict":
+        """Returns a dictionary without the key, raises KeyError if there
+        is no such key."""
+        original = key
+        key = self._key(key)
+        path, s, label, length, key_size = self._find(key)
+        key &= (1 << key_size) - 1
+        if s is None or length != key_size or key != label:
+            raise KeyError(original)
+        if not path:
+            return type(self)(None, self.key_size)
+
+        # the sibling takes the place of the fork, their labels are joined
+        label, length, key_size, refs, bit = path.pop()
+        s = refs[1 - bit].begin_parse()
+        child_size = key_size - length - 1
+        child_label, child_length = read_label(s, child_size)
+        label = (label << 1 | 1 - bit) << child_length | child_label
+        return self._rebuild(
+            path, _edge(label, length + 1 + child_length, key_size, s)
+        )
+
+    def merge(self, other: "PersistentDict | Items") -> "PersistentDict":
+        """Returns a dictionary with the items of other added, values of
+        other win."""
+        if isinstance(other, PersistentDict):
+            if other.key_size != self.key_size:
+                raise ValueError("Dictionaries have different key sizes")
+            if self.root is None:
+                return other
+            items: Iterable[tuple[int, Cell]] = other.items()
+        elif isinstance(other, Mapping):
+            items = other.items()
+        else:
+            items = other
+
+        result = self
+        for key, value in items:
+            result = result.set(key, value)
+        return result
+
+
+__all__ = [
+    "PersistentDict",
+]
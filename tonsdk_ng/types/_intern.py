@@ -0,0 +1,131 @@
+import threading
+from collections import OrderedDict
+
+from ._cell import Cell, FrozenRefs
+
+
+class CellStore:
+    """Table of canonical frozen cells by representation hash.
+
+    Interning a tree returns its canonical instance: cells already in the
+    table are reused together with their cached hashes, the others are
+    added. The least recently used cells are evicted when the table is
+    larger than max_size."""
+
+    def __init__(self, max_size: int = 100_000):
+        if max_size <= 0:
+            raise ValueError("Cell store size should be positive")
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self._cells: OrderedDict[bytes, Cell] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._cells)
+
+    def __contains__(self, cell_hash: bytes) -> bool:
+        return cell_hash in self._cells
+
+    def get(self, cell_hash: bytes) -> Cell | None:
+        with self._lock:
+            return self._get(cell_hash)
+
+    def _get(self, cell_hash: bytes) -> Cell | None:
+        # the caller holds the lock
+        cell = self._cells.get(cell_hash)
+        if cell is not None:
+            self._cells.move_to_end(cell_hash)
+        return cell
+
+    def clear(self) -> None:
+        with self._lock:
+            self._cells.clear()
+            self.hits = self.misses = 0
+
+    def _add(self, cell_hash: bytes, cell: Cell) -> Cell:
+        with self._lock:
+            self.misses += 1
+            # another thread may have added it meanwhile
+            cell = self._cells.setdefault(cell_hash, cell)
+            self._cells.move_to_end(cell_hash)
+            if len(self._cells) > self.max_size:
+                self._cells.popitem(last=False)
+            return cell
+
+    def intern(self, root: Cell) -> Cell:
+        """Returns the canonical instance of the tree, the tree is frozen.
+
+        Refs of the added cells are canonical too, cells which reference
+        non-canonical refs are copied."""
+        root.freeze()
+        canonical: dict[int, Cell] = {}
+        stack = [(root, False)]
+        while stack:
+            cell, refs_ready = stack.pop()
+            if id(cell) in canonical:
+                continue
+            cell_hash = cell.bytes_hash()
+            if not refs_ready:
+                with self._lock:
+                    found = self._get(cell_hash)
+                    if found is not None:
+                        self.hits += 1
+                if found is not None:
+                    canonical[id(cell)] = found
+                    continue
+                stack.append((cell, True))
+                stack.extend((ref, False) for ref in cell.refs)
+                continue
+
+            refs = [canonical[id(ref)] for ref in cell.refs]
+            new = cell
+            if any(c is not r for c, r in zip(refs, cell.refs, strict=True)):
+                # frozen bits and the hashes do not change with the refs
+                new = Cell()
+                new.bits = cell.bits
+                new.refs = FrozenRefs(refs)
+                new.is_exotic = cell.is_exotic
+                new._info = cell.get_info()
+            canonical[id(cell)] = self._add(cell_hash, new)
+        return canonical[id(root)]
+
+
+_store: CellStore | None = None
+
+
+def enable_cell_interning(max_size: int = 100_000) -> CellStore:
+    """Makes Builder.end_cell and BOC parsing return canonical cells from
+    a global CellStore of max_size cells, which is returned.
+
+    Lazily parsed BOCs are not interned."""
+    global _store
+    _store = CellStore(max_size)
+    return _store
+
+
+def disable_cell_interning() -> None:
+    global _store
+    _store = None
+
+
+def get_cell_store() -> CellStore | None:
+    return _store
+
+
+def intern_cell(cell: Cell) -> Cell:
+    """Returns the canonical instance of the tree if interning is enabled,
+    the tree itself otherwise."""
+    store = _store
+    if store is None:
+        return cell
+    return store.intern(cell)
+
+
+__all__ = [
+    "CellStore",
+    "disable_cell_interning",
+    "enable_cell_interning",
+    "get_cell_store",
+    "intern_cell",
+]
@@ -0,0 +1,142 @@
+from __future__ import annotations
+
+from typing import Any
+
+from ._bit_string import BitString
+from ._cell import Cell, FrozenRefs, RawCell, check_ref_index, read_raw_cell
+
+
+class LazyBoc:
+    """Cells data of a parsed BOC, see from_boc_multi_root(lazy=True)."""
+
+    def __init__(
+        self,
+        payload: bytes | memoryview,
+        cells_num: int,
+        ref_sz_bytes: int,
+        index: bytes | memoryview | None,
+        offset_bytes: int,
+        has_cache_bits: bool,
+    ):
+        self.payload = memoryview(payload)
+        self.cells_num = cells_num
+        self.ref_sz_bytes = ref_sz_bytes
+        self.index = None if index is None else memoryview(index)
+        self.offset_bytes = offset_bytes
+        self.has_cache_bits = has_cache_bits
+        self._offsets: list[int] | None = None
+        self._cells: dict[int, LazyCell] = {}
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        return LazyBoc, (
+            bytes(self.payload),
+            self.cells_num,
+            self.ref_sz_bytes,
+            None if self.index is None else bytes(self.index),
+            self.offset_bytes,
+            self.has_cache_bits,
+        )
+
+    def cell(self, i: int) -> LazyCell:
+        """Returns the cell by its index, the same object for every call."""
+        if not 0 <= i < self.cells_num:
+            raise ValueError("Invalid index, out of scope")
+        cell = self._cells.get(i)
+        if cell is None:
+            cell = self._cells[i] = LazyCell(self, i)
+        return cell
+
+    def cell_offset(self, i: int) -> int:
+        if self.index is not None:
+            if i == 0:
+                return 0
+            # index stores end of each cell
+            pos = (i - 1) * self.offset_bytes
+            end = int.from_bytes(
+                self.index[pos : pos + self.offset_bytes], "big"
+            )
+            return end >> self.has_cache_bits
+
+        if self._offsets is None:
+            # without index headers of all cells are scanned once
+            offsets = []
+            offset = 0
+            for _ in range(self.cells_num):
+                offsets.append(offset)
+                offset = read_raw_cell(
+                    self.payload, offset, self.ref_sz_bytes
+                ).end
+            self._offsets = offsets
+        return self._offsets[i]
+
+    def read_raw_cell(self, i: int) -> RawCell:
+        raw = read_raw_cell(
+            self.payload, self.cell_offset(i), self.ref_sz_bytes
+        )
+        for ref in raw.refs:
+            check_ref_index(i, ref, self.cells_num, self.index is not None)
+        return raw
+
+
+class LazyCell(Cell):
+    """Frozen cell of a parsed BOC which is decoded on first access.
+
+    Reading bits, refs or is_exotic decodes this cell only, its refs are
+    lazy cells too."""
+
+    def __init__(self, boc: LazyBoc, index: int):
+        self._boc = boc
+        self._index = index
+        self._info = None
+        self._bits: BitString | None = None
+        self._refs: FrozenRefs | None = None
+        self._is_exotic = False
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        return LazyBoc.cell, (self._boc, self._index)
+
+    def _decode(self) -> None:
+        raw = self._boc.read_raw_cell(self._index)
+        bits = BitString(0)
+        bits.array = bytearray(raw.data)
+        bits.length = raw.bits_sz
+        bits.cursor = raw.bits_sz
+        bits.freeze()
+        self._is_exotic = raw.is_exotic
+        self._refs = FrozenRefs(self._boc.cell(ref) for ref in raw.refs)
+        self._bits = bits
+
+    @property
+    def bits(self) -> BitString:
+        if self._bits is None:
+            self._decode()
+        assert self._bits is not None
+        return self._bits
+
+    @bits.setter
+    def bits(self, value: BitString) -> None:
+        raise Exception("Cell is frozen")
+
+    @property
+    def refs(self) -> list[Cell]:
+        if self._refs is None:
+            self._decode()
+        assert self._refs is not None
+        return self._refs
+
+    @refs.setter
+    def refs(self, value: list[Cell]) -> None:
+        raise Exception("Cell refs are frozen")
+
+    @property
+    def is_exotic(self) -> bool:
+        if self._bits is None:
+            self._decode()
+        return self._is_exotic
+
+    @is_exotic.setter
+    def is_exotic(self, value: bool) -> None:
+        raise Exception("Cell is frozen")
+
+    def is_frozen(self) -> bool:
+        return True
@@ -0,0 +1,118 @@
+from collections.abc import Iterable
+
+from ._cell import Cell, CellInfo, CellType
+
+
+def _exotic_cell(cell_type: CellType) -> Cell:
+    cell = Cell()
+    cell.is_exotic = True
+    cell.bits.write_uint(cell_type, 8)
+    return cell
+
+
+def create_pruned_branch(cell: Cell, level: int = 1) -> Cell:
+    """Replaces the cell with a pruned branch of the level.
+
+    The pruned branch keeps the hashes and depths of the cell, so the
+    hashes of the lower levels of the trees it is put in do not change.
+    The level should be higher than the cell level."""
+    return _pruned_branch(cell.get_info(), level)
+
+
+def _pruned_branch(info: CellInfo, level: int) -> Cell:
+    if not info.level < level <= 3:
+        raise ValueError(f"Can not prune a cell of level {info.level}")
+
+    pruned = _exotic_cell(CellType.PRUNED_BRANCH)
+    pruned.bits.write_uint(info.level_mask | 1 << (level - 1), 8)
+    for cell_hash in info.hashes:
+        pruned.bits.write_bytes(cell_hash)
+    for depth in info.depths:
+        pruned.bits.write_uint(depth, 16)
+    return pruned.freeze()
+
+
+def create_library_cell(library_hash: bytes) -> Cell:
+    """Creates a library cell referencing a library by its hash."""
+    if len(library_hash) != 32:
+        raise ValueError("Library hash should be 32 bytes long")
+    cell = _exotic_cell(CellType.LIBRARY)
+    cell.bits.write_bytes(library_hash)
+    return cell.freeze()
+
+
+def create_merkle_proof(root: Cell, keep: Iterable[bytes]) -> Cell:
+    """Creates a Merkle proof of the tree.
+
+    The proof contains the root and the cells whose representation hashes
+    are in keep, as long as their parents are kept too. Other refs of the
+    kept cells are replaced with pruned branches. Frozen kept subtrees
+    without pruned refs are shared with the original tree, unfrozen cells
+    are copied, so the tree itself is not modified."""
+    kept = set(keep)
+    # hashes of unfrozen cells are not cached on them, one memo for the
+    # whole walk computes every distinct cell once
+    computed: dict[int, CellInfo] = {}
+    # cells of the proof by the hashes of the original cells, kept cells
+    # and pruned refs are never the same cells
+    copies: dict[bytes, Cell] = {}
+
+    stack = [(root, False)]
+    while stack:
+        cell, refs_ready = stack.pop()
+        cell_hash = cell.get_info(computed).hash
+        if cell_hash in copies:
+            continue
+        if not refs_ready:
+            stack.append((cell, True))
+            for ref in cell.refs:
+                ref_info = ref.get_info(computed)
+                if ref_info.hash in kept:
+                    stack.append((ref, False))
+                elif ref_info.hash not in copies:
+                    copies[ref_info.hash] = _pruned_branch(ref_info, 1)
+            continue
+
+        refs = [copies[ref.get_info(computed).hash] for ref in cell.refs]
+        # the proof is frozen, so only frozen cells can be shared
+        if cell.is_frozen() and all(
+            copy is ref for copy, ref in zip(refs, cell.refs, strict=True)
+        ):
+            copies[cell_hash] = cell
+        else:
+            copy = Cell()
+            copy.is_exotic = cell.is_exotic
+            copy.bits.write_bit_string(cell.bits)
+            copy.refs = refs
+            copies[cell_hash] = copy.freeze()
+
+    proved = copies[root.get_info(computed).hash]
+    info = proved.get_info(computed)
+    proof = _exotic_cell(CellType.MERKLE_PROOF)
+    proof.bits.write_bytes(info.hashes[info.level_index(0)])
+    proof.bits.write_uint(info.depths[info.level_index(0)], 16)
+    proof.refs.append(proved)
+    return proof.freeze()
+
+
+def check_merkle_proof(proof: Cell, root_hash: bytes) -> Cell:
+    """Checks that the Merkle proof proves a tree with the root hash.
+
+    Returns the proved tree, the cells which are not included in the
+    proof are pruned branches. Raises ValueError if the proof is invalid
+    or proves another tree."""
+    if proof.get_type() != CellType.MERKLE_PROOF:
+        raise ValueError("Cell is not a Merkle proof")
+    # computing the proof hashes checks the stored hash of the tree
+    proof.get_info()
+    if proof.bits.array[1:33] != root_hash:
+        raise ValueError("Merkle proof is for another tree")
+    return proof.refs[0]
+
+
+__all__ = [
+    "check_merkle_proof",
+    "create_library_cell",
+    "create_merkle_proof",
+    "create_pruned_branch",
+]
@@ -1,85 +1,135 @@
 import bitarray
 
+from tonsdk_ng.exceptions import InvalidAddressError
+
 from ._address import Address
 from ._cell import Cell
 
 
 class Slice:
-    """Slice like an analog of slice in FunC. Used only for reading."""
+    """Slice like an analog of slice in FunC. Used only for reading.
+
+    The slice keeps a read offset over the cell data instead of consuming
+    its bits. Slices of frozen cells and their sub-slices share the cell's
+    buffer, data of unfrozen cells is copied when parsing begins."""
 
     def __init__(self, cell: Cell):
-        self.bits = bitarray.bitarray()
-        self.bits.frombytes(cell.bits.array)
-        self.bits = self.bits[: cell.bits.cursor]
+        data = cell.bits.array
+        if not cell.is_frozen():
+            data = bytes(data)
+        self._data = data
+        self._bits = bitarray.bitarray(buffer=data)
+        self._offset = 0
+        self._end = cell.bits.cursor
         self.refs: list[Cell] = cell.refs
         self.ref_offset = 0
 
+    @property
+    def bits(self) -> bitarray.bitarray:
+        """Copy of the bits left in the slice."""
+        return self._bits[self._offset : self._end]
+
     def __len__(self) -> int:
-        return len(self.bits)
+        return self._end - self._offset
 
     def __repr__(self) -> str:
         return hex(int(self.bits.to01(), 2))[2:].upper()
 
     def is_empty(self) -> bool:
-        return len(self.bits) == 0
+        return self._offset == self._end
 
     def end_parse(self) -> None:
         """Throws an exception if the slice is not empty."""
         if not self.is_empty() or self.ref_offset != len(self.refs):
             raise Exception("Slice is not empty.")
 
+    def _check_underflow(self, bit_count: int) -> None:
+        if bit_count < 0 or self._offset + bit_count > self._end:
+            raise Exception("Slice underflow")
+
     def read_bit(self) -> int:
         """Reads single bit from the slice."""
-        bit = self.bits[0]
-        del self.bits[0]
-        return int(bit)
+        bit = self.preload_bit()
+        self._offset += 1
+        return bit
 
     def preload_bit(self) -> int:
-        return int(self.bits[0])
+        self._check_underflow(1)
+        return self._bits[self._offset]
 
     def read_bits(self, bit_count: int) -> bitarray.bitarray:
-        bits = self.bits[:bit_count]
-        del self.bits[:bit_count]
+        bits = self.preload_bits(bit_count)
+        self._offset += bit_count
         return bits
 
     def preload_bits(self, bit_count: int) -> bitarray.bitarray:
-        return self.bits[:bit_count]
+        self._check_underflow(bit_count)
+        return self._bits[self._offset : self._offset + bit_count]
 
     def skip_bits(self, bit_count: int) -> None:
-        del self.bits[:bit_count]
+        self._check_underflow(bit_count)
+        self._offset += bit_count
+
+    def read_slice(self, bit_count: int, refs_count: int = 0) -> "Slice":
+        """Reads a sub-slice of the next bits and refs. The sub-slice
+        shares the data buffer with this slice."""
+        sub = self.preload_slice(bit_count, refs_count)
+        self._offset += bit_count
+        self.ref_offset += refs_count
+        return sub
+
+    def preload_slice(self, bit_count: int, refs_count: int = 0) -> "Slice":
+        self._check_underflow(bit_count)
+        if self.ref_offset + refs_count > len(self.refs):
+            raise Exception("Slice refs underflow")
+
+        sub = Slice.__new__(Slice)
+        sub._data = self._data
+        sub._bits = self._bits
+        sub._offset = self._offset
+        sub._end = self._offset + bit_count
+        sub.refs = self.refs[self.ref_offset : self.ref_offset + refs_count]
+        sub.ref_offset = 0
+        return sub
+
+    def _preload_uint(self, offset: int, bit_length: int) -> int:
+        if bit_length < 0 or offset + bit_length > self._end:
+            raise Exception("Slice underflow")
+        end = offset + bit_length
+        first, last = offset >> 3, (end + 7) >> 3
+        value = int.from_bytes(self._data[first:last], "big")
+        value >>= (last << 3) - end
+        return value & ((1 << bit_length) - 1)
 
     def read_uint(self, bit_length: int) -> int:
-        value = self.bits[:bit_length]
-        del self.bits[:bit_length]
-        return int(value.to01(), 2)
+        value = self._preload_uint(self._offset, bit_length)
+        self._offset += bit_length
+        return value
 
     def preload_uint(self, bit_length: int) -> int:
-        value = self.bits[:bit_length]
-        return int(value.to01(), 2)
+        return self._preload_uint(self._offset, bit_length)
 
     def read_bytes(self, bytes_count: int) -> bytes:
-        length = bytes_count * 8
-        value = self.bits[:length]
-        del self.bits[:length]
-        return bytes(value.tobytes())
+        offset = self._offset
+        if offset & 7:
+            value = self._preload_uint(offset, bytes_count * 8)
+            data = value.to_bytes(bytes_count, "big")
+        else:
+            self._check_underflow(bytes_count * 8)
+            data = bytes(self._data[offset >> 3 : (offset >> 3) + bytes_count])
+        self._offset += bytes_count * 8
+        return data
 
     def read_int(self, bit_length: int) -> int:
-        if bit_length == 1:
-            # if num is -1 then bit is 1. if 0 then 1. see _bit_string.py
-            return -self.read_bit()
-        else:
-            is_negative = self.read_bit()
-            value = self.read_uint(bit_length - 1)
-            if is_negative == 1:
-                # ones complement
-                return int(-(2 ** (bit_length - 1) - value))
-            else:
-                return value
+        value = self.preload_int(bit_length)
+        self._offset += bit_length
+        return value
 
     def preload_int(self, bit_length: int) -> int:
-        tmp = self.bits
-        value = self.read_int(bit_length)
-        self.bits = tmp
+        value = self._preload_uint(self._offset, bit_length)
+        # two's complement, also gives -1 for a single set bit
+        if bit_length and value >> (bit_length - 1):
+            value -= 1 << bit_length
         return value
 
     def read_msg_addr(self) -> Address | None:
@@ -87,10 +137,20 @@ class Slice:
         May return None if there is a zero-address."""
         if self.read_uint(2) == 0:
             return None
-        self.read_bit()  # anycast
-        workchain_id = hex(self.read_int(8)).replace("0x", "")
-        hashpart = self.read_bytes(32).hex()
-        return Address.from_string(workchain_id + ":" + hashpart)
+        # anycast bit is skipped, then workchain_id:int8 address:bits256
+        value = self._preload_uint(self._offset + 1, 264)
+        self._offset += 265
+        workchain_id = (value >> 256) - ((value >> 263) << 8)
+        if workchain_id != 0 and workchain_id != -1:
+            raise InvalidAddressError(f"Invalid address wc {workchain_id}")
+        return Address(
+            wc=workchain_id,
+            hash_part=(value & ((1 << 256) - 1)).to_bytes(32, "big"),
+            is_user_friendly=False,
+            is_url_safe=False,
+            is_bounceable=False,
+            is_test_only=False,
+        )
 
     def read_coins(self) -> int:
         """Reads an amount of coins from the slice. Returns nanocoins."""
@@ -108,7 +168,7 @@ class Slice:
         """Reads string from the slice.
         If length is 0, then reads string until the end of the slice."""
         if length == 0:
-            length = len(self.bits) // 8
+            length = len(self) // 8
         return self.read_bytes(length).decode("utf-8")
 
     def read_ref(self) -> Cell:
@@ -120,6 +180,15 @@ class Slice:
     def preload_ref(self) -> Cell:
         return self.refs[self.ref_offset]
 
+    def read_rest(self) -> Cell:
+        """Reads the bits and refs left in the slice as a new frozen cell."""
+        cell = Cell()
+        cell.bits._write_bit_run(self.bits.tobytes(), len(self))
+        cell.refs = self.refs[self.ref_offset :]
+        self._offset = self._end
+        self.ref_offset = len(self.refs)
+        return cell.freeze()
+
     def load_dict(self) -> Cell | None:
         """Loads dictionary like a Cell from the slice.
         Returns None if the dictionary was null()."""
@@ -0,0 +1,366 @@
+"""Compiles TL-B constructors into specialized encoders and decoders.
+
+Only a practical subset of TL-B is supported, enough for message
+layouts::
+
+    transfer#0f8a7ea5 query_id:uint64 amount:Coins
+        destination:MsgAddress response_destination:MsgAddress
+        custom_payload:(Maybe ^Cell) forward_ton_amount:Coins
+        forward_payload:(Either Cell ^Cell) = InternalMsgBody
+
+Field types: uintN, intN, (## N), bitsN (N divisible by 8), Bool,
+Coins/Grams/(VarUInteger 16), MsgAddress, MsgAddressInt, ^Cell,
+(Maybe T), Cell and (Either Cell ^Cell) as the last field.
+
+Consecutive fixed-width fields, including the constructor tag, are
+merged into a single integer written or read at once.
+"""
+
+from __future__ import annotations
+
+import keyword
+import re
+from typing import Any, NamedTuple
+
+from ._address import Address
+from ._builder import Builder
+from ._cell import Cell
+from ._slice import Slice
+
+_CONSTRUCTOR = re.compile(
+    r"^(?P<name>[A-Za-z_]\w*)(?:#(?P<hex>[0-9a-fA-F]+)|\$(?P<bin>[01]+))?$"
+)
+_FIXED_TYPE = re.compile(r"^(?P<kind>uint|int|bits)(?P<size>\d+)$")
+_FIXED_KINDS = ("uint", "int", "bits", "bool")
+# globals of the generated code, fields can not shadow them
+_RESERVED = frozenset(
+    ("ValueError", "bool", "int", "len", "read_address_int", "store_payload")
+)
+
+
+class _Type(NamedTuple):
+    kind: str
+    size: int = 0
+    inner: _Type | None = None
+
+
+class _Field(NamedTuple):
+    name: str
+    type: _Type
+
+
+def _split(text: str) -> list[str]:
+    """Splits by whitespace outside of parentheses."""
+    tokens, depth, token = [], 0, ""
+    for char in text:
+        if char.isspace() and depth == 0:
+            if token:
+                tokens.append(token)
+            token = ""
+            continue
+        depth += (char == "(") - (char == ")")
+        if depth < 0:
+            raise ValueError(f"Unbalanced parentheses in {text!r}")
+        token += char
+    if depth:
+        raise ValueError(f"Unbalanced parentheses in {text!r}")
+    if token:
+        tokens.append(token)
+    return tokens
+
+
+def _parse_type(text: str) -> _Type:
+    while text.startswith("(") and text.endswith(")"):
+        text = text[1:-1].strip()
+
+    words = _split(text)
+    match words:
+        case ["Bool"]:
+            return _Type("bool", 1)
+        case ["Coins"] | ["Grams"] | ["VarUInteger", "16"]:
+            return _Type("coins")
+        case ["MsgAddress"]:
+            return _Type("address")
+        case ["MsgAddressInt"]:
+            return _Type("address_int")
+        case ["^Cell"]:
+            return _Type("ref")
+        case ["Cell"]:
+            return _Type("rest")
+        case ["##", size] if size.isdigit():
+            return _Type("uint", int(size))
+        case ["Maybe", inner]:
+            inner_type = _parse_type(inner)
+            if inner_type.kind in ("rest", "either"):
+                raise ValueError(f"Unsupported type {text!r}")
+            return _Type("maybe", inner=inner_type)
+        case ["Either", "Cell", "^Cell"]:
+            return _Type("either")
+        case [word] if (fixed := _FIXED_TYPE.match(word)) is not None:
+            kind, size = fixed["kind"], int(fixed["size"])
+            if size == 0 or kind == "bits" and size % 8:
+                raise ValueError(f"Unsupported type {text!r}")
+            return _Type(kind, size)
+    raise ValueError(f"Unsupported type {text!r}")
+
+
+class TLBConstructor:
+    """A TL-B constructor compiled into encode and decode functions.
+
+    encode() builds a frozen cell from keyword arguments named after the
+    fields, decode() returns a dict of field values accepted back by
+    encode(). store() and load() work with a builder and a slice already
+    in progress."""
+
+    def __init__(self, schema: str):
+        tokens = _split(schema.strip().rstrip(";"))
+        if len(tokens) < 3 or tokens[-2] != "=":
+            raise ValueError("Schema should end with '= TypeName'")
+        self.type_name = tokens[-1]
+
+        constructor = _CONSTRUCTOR.match(tokens[0])
+        if constructor is None:
+            raise ValueError(f"Invalid constructor {tokens[0]!r}")
+        self.name = constructor["name"]
+        if constructor["hex"] is not None:
+            self.tag = int(constructor["hex"], 16)
+            self.tag_bits = len(constructor["hex"]) * 4
+        elif constructor["bin"] is not None:
+            self.tag = int(constructor["bin"], 2)
+            self.tag_bits = len(constructor["bin"])
+        else:
+            self.tag = self.tag_bits = 0
+
+        self.fields: list[_Field] = []
+        for token in tokens[1:-2]:
+            name, sep, type_text = token.partition(":")
+            if not sep or not name.isidentifier() or name.startswith("_"):
+                raise ValueError(f"Invalid field {token!r}")
+            if keyword.iskeyword(name) or name in _RESERVED:
+                raise ValueError(f"Reserved field name {name!r}")
+            if name in (f.name for f in self.fields):
+                raise ValueError(f"Duplicate field {name!r}")
+            self.fields.append(_Field(name, _parse_type(type_text)))
+        for field in self.fields[:-1]:
+            if field.type.kind in ("rest", "either"):
+                raise ValueError(f"{field.name} should be the last field")
+
+        self.source = _generate(self)
+        namespace: dict[str, Any] = {
+            "read_address_int": _read_address_int,
+            "store_payload": _store_payload,
+        }
+        exec(compile(self.source, f"<tlb {self.name}>", "exec"), namespace)
+        self.store = namespace["store"]
+        self.load = namespace["load"]
+
+    def __repr__(self) -> str:
+        return f"<TLBConstructor {self.name} = {self.type_name}>"
+
+    def encode(self, **fields: Any) -> Cell:
+        return self.store(Builder(), **fields).end_cell()
+
+    def decode(self, cell: Cell) -> dict[str, Any]:
+        """Decodes the whole cell, leftover bits or refs are an error."""
+        s = cell.begin_parse()
+        result: dict[str, Any] = self.load(s)
+        s.end_parse()
+        return result
+
+
+def _read_address_int(s: Slice) -> Address:
+    address = s.read_msg_addr()
+    if address is None:
+        raise ValueError("Expected an internal address, got addr_none")
+    return address
+
+
+def _store_payload(builder: Builder, payload: Cell | None) -> None:
+    """Either Cell ^Cell, inline when the payload fits."""
+    if payload is None:
+        builder.store_bit(0)
+    elif (
+        payload.bits.get_used_bits() < builder.bits.get_free_bits()
+        and len(builder.refs) + len(payload.refs) <= 4
+    ):
+        builder.store_bit(0).store_cell(payload)
+    else:
+        builder.store_bit(1).store_ref(payload)
+
+
+def _fixed_runs(
+    constructor: TLBConstructor,
+) -> list[list[_Field] | _Field]:
+    """Groups consecutive fixed-width fields, the tag included, into runs.
+    ^Cell fields take no bits and do not break a run."""
+    items: list[list[_Field] | _Field] = []
+    run: list[_Field] = []
+    refs: list[_Field] = []
+    fields = list(constructor.fields)
+    if constructor.tag_bits:
+        fields.insert(0, _Field("", _Type("tag", constructor.tag_bits)))
+    for field in fields:
+        if field.type.kind in _FIXED_KINDS or field.type.kind == "tag":
+            run.append(field)
+        elif field.type.kind == "ref" and run:
+            refs.append(field)
+        else:
+            if run:
+                items.append(run)
+                items.extend(refs)
+                run, refs = [], []
+            items.append(field)
+    if run:
+        items.append(run)
+        items.extend(refs)
+    return items
+
+
+def _encode_fixed(
+    constructor: TLBConstructor, field: _Field, lines: list[str], indent: str
+) -> str:
+    """Adds range checks and returns an expression of the unsigned value."""
+    name, (kind, size, _) = field
+    if kind == "tag":
+        return str(constructor.tag)
+    if kind == "bool":
+        return f"(1 if {name} else 0)"
+    if kind == "bits":
+        lines.append(f"{indent}if len({name}) != {size // 8}:")
+        lines.append(
+            f"{indent}    raise ValueError('{name} should be "
+            f"{size // 8} bytes long')"
+        )
+        return f'int.from_bytes({name}, "big")'
+    if kind == "uint":
+        lines.append(f"{indent}if not 0 <= {name} < {1 << size}:")
+        lines.append(
+            f"{indent}    raise ValueError(f'{name}={{{name}}} "
+            f"does not fit uint{size}')"
+        )
+        return name
+    half = 1 << (size - 1)
+    lines.append(f"{indent}if not {-half} <= {name} < {half}:")
+    lines.append(
+        f"{indent}    raise ValueError(f'{name}={{{name}}} "
+        f"does not fit int{size}')"
+    )
+    return f"({name} & {(1 << size) - 1})"
+
+
+def _encode_field(
+    constructor: TLBConstructor,
+    field: _Field,
+    value: str,
+    lines: list[str],
+    indent: str,
+) -> None:
+    kind = field.type.kind
+    if kind in _FIXED_KINDS:
+        expr = _encode_fixed(
+            constructor, _Field(value, field.type), lines, indent
+        )
+        lines.append(f"{indent}_bits.write_bits({expr}, {field.type.size})")
+    elif kind == "coins":
+        lines.append(f"{indent}_bits.write_coins({value})")
+    elif kind in ("address", "address_int"):
+        if kind == "address_int":
+            lines.append(f"{indent}if {value} is None:")
+            lines.append(
+                f"{indent}    raise ValueError('{field.name} can not be none')"
+            )
+        lines.append(f"{indent}_bits.write_address({value})")
+    elif kind == "ref":
+        lines.append(f"{indent}_builder.store_ref({value})")
+    elif kind == "rest":
+        lines.append(f"{indent}_builder.store_cell({value})")
+    elif kind == "either":
+        lines.append(f"{indent}store_payload(_builder, {value})")
+    elif kind == "maybe":
+        assert field.type.inner is not None
+        lines.append(f"{indent}if {value} is None:")
+        lines.append(f"{indent}    _bits.write_bit(0)")
+        lines.append(f"{indent}else:")
+        lines.append(f"{indent}    _bits.write_bit(1)")
+        inner = _Field(field.name, field.type.inner)
+        _encode_field(constructor, inner, value, lines, indent + "    ")
+
+
+def _decode_field(field: _Field) -> str:
+    kind = field.type.kind
+    if kind in ("uint", "int"):
+        return f"_s.read_{kind}({field.type.size})"
+    if kind == "bool":
+        return "bool(_s.read_bit())"
+    if kind == "bits":
+        return f"_s.read_bytes({field.type.size // 8})"
+    if kind == "coins":
+        return "_s.read_coins()"
+    if kind == "address":
+        return "_s.read_msg_addr()"
+    if kind == "address_int":
+        return "read_address_int(_s)"
+    if kind == "ref":
+        return "_s.read_ref()"
+    if kind == "rest":
+        return "_s.read_rest()"
+    if kind == "either":
+        return "_s.read_ref() if _s.read_bit() else _s.read_rest()"
+    assert field.type.inner is not None
+    inner = _decode_field(_Field(field.name, field.type.inner))
+    return f"({inner} if _s.read_bit() else None)"
+
+
+def _generate(constructor: TLBConstructor) -> str:
+    names = [f.name for f in constructor.fields]
+    params = "".join(f", {name}" for name in names)
+    store = [f"def store(_builder{', *' if names else ''}{params}):"]
+    store.append("    _bits = _builder.bits")
+    load = ["def load(_s):"]
+
+    for item in _fixed_runs(constructor):
+        if isinstance(item, _Field):
+            _encode_field(constructor, item, item.name, store, "    ")
+            load.append(f"    {item.name} = {_decode_field(item)}")
+            continue
+
+        total = sum(f.type.size for f in item)
+        parts, shift = [], total
+        load.append(f"    _value = _s.read_uint({total})")
+        for field in item:
+            size = field.type.size
+            shift -= size
+            if field.type.kind == "tag":
+                if constructor.tag:
+                    parts.append(str(constructor.tag << shift))
+            else:
+                expr = _encode_fixed(constructor, field, store, "    ")
+                parts.append(f"({expr} << {shift})" if shift else expr)
+
+            # the first field takes the top bits and needs no mask
+            part = f"(_value >> {shift})" if shift else "_value"
+            if shift + size < total:
+                part = f"({part} & {(1 << size) - 1})"
+            if field.type.kind == "tag":
+                load.append(f"    if {part} != {constructor.tag}:")
+                load.append(
+                    f"        raise ValueError('Not a {constructor.name}, "
+                    f"tag mismatch')"
+                )
+            elif field.type.kind == "bool":
+                load.append(f"    {field.name} = bool({part})")
+            elif field.type.kind == "bits":
+                load.append(
+                    f"    {field.name} = {part}.to_bytes({size // 8}, 'big')"
+                )
+            elif field.type.kind == "int":
+                half = 1 << (size - 1)
+                load.append(f"    {field.name} = ({part} ^ {half}) - {half}")
+            else:
+                load.append(f"    {field.name} = {part}")
+        value = " | ".join(parts) or "0"
+        store.append(f"    _bits.write_bits({value}, {total})")
+
+    store.append("    return _builder")
+    load.append("    return {" + ", ".join(f"{n!r}: {n}" for n in names) + "}")
+    return "\n".join(store) + "\n\n\n" + "\n".join(load) + "\n"
@@ -1,13 +1,18 @@
 from ._currency import TonCurrencyEnum, from_nano, to_nano
+from ._parallel import map_chunks, map_chunks_async
 from ._utils import (
     b64str_to_bytes,
     b64str_to_hex,
     bytes_to_b64str,
     crc16,
+    crc16_many,
     crc32c,
     move_to_end,
+    sign_detached,
+    sign_many,
     sign_message,
     string_to_bytes,
+    topological_sort,
     tree_walk,
 )
 
@@ -17,11 +22,17 @@ __all__ = [
     "b64str_to_hex",
     "bytes_to_b64str",
     "crc16",
+    "crc16_many",
     "crc32c",
     "from_nano",
+    "map_chunks",
+    "map_chunks_async",
     "move_to_end",
+    "sign_detached",
+    "sign_many",
     "sign_message",
     "string_to_bytes",
     "to_nano",
+    "topological_sort",
     "tree_walk",
 ]
@@ -0,0 +1,82 @@
+import asyncio
+import os
+from collections.abc import Callable, Iterable
+from concurrent.futures import Executor, ProcessPoolExecutor
+from typing import TypeVar
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+ChunkFunc = Callable[[list[T]], list[R]]
+
+
+def _chunks(items: list[T], chunk_size: int) -> list[list[T]]:
+    return [
+        items[start : start + chunk_size]
+        for start in range(0, len(items), chunk_size)
+    ]
+
+
+def map_chunks(
+    func: ChunkFunc[T, R],
+    items: Iterable[T],
+    workers: int | None = None,
+    executor: Executor | None = None,
+    chunk_size: int = 64,
+) -> list[R]:
+    """Applies func to the items by chunks of `chunk_size` and returns the
+    results of all chunks in the input order, func returns a result for
+    every item of its chunk.
+
+    Chunks are processed in `executor`, or in a process pool of `workers`
+    processes (CPU count by default) created for the call, so func should
+    be picklable. Batches not larger than one chunk are processed in the
+    calling process, as well as any batch with workers=1."""
+    items = list(items)
+    if executor is None and (workers == 1 or len(items) <= chunk_size):
+        return func(items)
+
+    chunks = _chunks(items, chunk_size)
+    if executor is not None:
+        results = list(executor.map(func, chunks))
+    else:
+        workers = min(workers or os.cpu_count() or 1, len(chunks))
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            results = list(pool.map(func, chunks))
+    return [result for chunk in results for result in chunk]
+
+
+async def map_chunks_async(
+    func: ChunkFunc[T, R],
+    items: Iterable[T],
+    workers: int | None = None,
+    executor: Executor | None = None,
+    chunk_size: int = 64,
+) -> list[R]:
+    """Same as map_chunks, but awaits the chunks without blocking the event
+    loop. All chunks are processed in the executor or the process pool,
+    even for small batches."""
+    items = list(items)
+    if not items:
+        return []
+
+    chunks = _chunks(items, chunk_size)
+    pool = executor or ProcessPoolExecutor(
+        max_workers=min(workers or os.cpu_count() or 1, len(chunks))
+    )
+    loop = asyncio.get_running_loop()
+    try:
+        results = await asyncio.gather(
+            *(loop.run_in_executor(pool, func, chunk) for chunk in chunks)
+        )
+    finally:
+        if executor is None:
+            # the workers are idle or the call is cancelled, do not wait
+            pool.shutdown(wait=False, cancel_futures=True)
+    return [result for chunk in results for result in chunk]
+
+
+__all__ = [
+    "map_chunks",
+    "map_chunks_async",
+]